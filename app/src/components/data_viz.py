@@ -1,17 +1,20 @@
-import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+
 import streamlit as st
+import streamlit.components.v1 as components
 import pandas as pd
 import geopandas as gpd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-from src.components.utils import *
+import shapely
+from shapely.geometry import mapping
+from src.components.utils import vertical_spacer, split_row
 
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from src.db import db as database, Table
 
-from shapely import wkt
-from urllib.request import urlopen
-from plotly.subplots import make_subplots
 
 
 __all__ = [
@@ -64,11 +67,201 @@ choropleth_config = {
 }
 
 
+# Integer RGB components of the risk palette, indexed by risk bucket
+RISK_COLORS_RGB = [
+    tuple(int(c) for c in color[4:-1].split(',')) for color in DIVERGING_RGB
+]
+
+
+@lru_cache(maxsize=256)
+def _risk_rgba(bucket, opacity):
+    """Format the rgba string for a risk bucket, cached per (bucket, opacity)"""
+    r, g, b = RISK_COLORS_RGB[bucket]
+    return f"rgba({r}, {g}, {b}, {opacity})"
+
+
+def _risk_levels(scores):
+    """
+    Bucket 0-100 risk scores into RISK_LEVELS.
+
+    Bins are [0, 20], (20, 40], ..., (80, 100]; missing or out-of-range scores
+    are left unassigned. Equivalent to pd.cut with include_lowest=True, but
+    done with a single np.digitize call on the underlying array.
+
+    Parameters:
+    -----------
+    scores : pandas.Series or array-like
+        Risk scores between 0 and 100
+
+    Returns:
+    --------
+    pandas.Categorical
+        Ordered categorical of RISK_LEVELS labels
+    """
+    scores = np.asarray(scores, dtype=float)
+    codes = np.digitize(scores, [20, 40, 60, 80], right=True)
+    codes[~((scores >= 0) & (scores <= 100))] = -1
+    return pd.Categorical.from_codes(codes, categories=RISK_LEVELS, ordered=True)
+
+
 def get_risk_color(score, opacity=1.0):
     """Get color for a risk score with specified opacity"""
-    color_index = min(int(score // 20), 4)
-    r, g, b = DIVERGING_RGB[color_index]
-    return f"rgba({r}, {g}, {b}, {opacity})"
+    return _risk_rgba(min(max(int(score // 20), 0), 4), opacity)
+
+
+# Z-score bin edges and their descriptions, from best to worst for an
+# indicator where lower values are better
+Z_SCORE_EDGES = np.array([-1.5, -0.5, 0.5, 1.5])
+Z_SCORE_DESCRIPTIONS = np.array(
+    ["Excellent", "Good", "Average", "Below Average", "Poor"])
+
+
+def _z_score_description(z_score, is_inverse=False):
+    """
+    Describe a z-score relative to the national average.
+
+    Parameters:
+    -----------
+    z_score : float
+        Standard deviations from the national mean
+    is_inverse : bool
+        True for indicators where lower values are better
+
+    Returns:
+    --------
+    str
+        One of Z_SCORE_DESCRIPTIONS
+    """
+    # Flip regular indicators so a single table serves both directions;
+    # side='right' keeps the bin edges themselves in the better bin
+    bucket = np.searchsorted(Z_SCORE_EDGES, z_score if is_inverse else -z_score,
+                             side='right')
+    return Z_SCORE_DESCRIPTIONS[bucket]
+
+
+@st.cache_resource(show_spinner=False)
+def _load_county_gdf():
+    """
+    Load the county geometries once per process as a simplified GeoDataFrame.
+
+    Geometry decoding and simplification are the most expensive steps of every
+    choropleth, so the result is shared across reruns and sessions. Callers
+    must treat the returned frame as read-only (merge into a new frame rather
+    than assigning columns).
+    """
+    county_data = database.get_county_geometries()
+
+    if 'geometry_wkb' in county_data.columns:
+        # Decode hex-encoded WKB in a single vectorized call
+        county_data['geometry'] = shapely.from_wkb(
+            county_data.pop('geometry_wkb').to_numpy(dtype=object))
+    else:
+        # Fall back to WKT for databases loaded before WKB storage. Skip the
+        # decode entirely when the column already holds geometry objects;
+        # from_wkt passes missing values through as None.
+        geometries = county_data['geometry']
+        first_valid = geometries.first_valid_index()
+        if first_valid is not None and isinstance(geometries.loc[first_valid], str):
+            county_data['geometry'] = shapely.from_wkt(
+                geometries.to_numpy(dtype=object))
+
+    # Extract the state FIPS from county FIPS (first 2 digits) once, as a
+    # low-cardinality categorical
+    county_data['state_fips'] = (
+        county_data['county_fips'].astype(str).str.zfill(5).str[:2].astype('category')
+    )
+
+    # Get centroids of the full-resolution geometries for marker placement
+    centroids = shapely.centroid(county_data['geometry'].to_numpy(dtype=object))
+    county_data['centroid_lon'] = shapely.get_x(centroids)
+    county_data['centroid_lat'] = shapely.get_y(centroids)
+
+    # Simplify the geometry once rather than on every rerun, as a single
+    # vectorized call over the geometry array
+    county_data['geometry'] = shapely.simplify(
+        county_data['geometry'].to_numpy(dtype=object),
+        tolerance=0.001,
+        preserve_topology=True,
+    )
+
+    return gpd.GeoDataFrame(county_data, geometry='geometry')
+
+
+@st.cache_resource(show_spinner=False)
+def _load_county_geojson():
+    """
+    Build the GeoJSON for the simplified county boundaries once per process.
+
+    Features are keyed by county FIPS code, so choropleths can pass
+    ``locations='county_fips'`` instead of serializing their own frame.
+    """
+    gdf = _load_county_gdf()
+
+    # Build the FeatureCollection directly from the geometries, skipping the
+    # encode/decode round trip through a JSON string
+    features = [
+        {
+            "type": "Feature",
+            "id": fips,
+            "properties": {},
+            "geometry": None if geom is None else mapping(geom),
+        }
+        for fips, geom in zip(gdf['county_fips'].tolist(), gdf.geometry.array)
+    ]
+
+    return {"type": "FeatureCollection", "features": features}
+
+
+def _county_choropleth(data_frame, title, **kwargs):
+    """
+    Create a US county choropleth with the styling shared by all dashboard maps.
+
+    Parameters:
+    -----------
+    data_frame : pandas.DataFrame
+        Data to plot, with one row per county and a 'county_fips' column
+    title : str
+        Map title
+    **kwargs
+        Additional keyword arguments passed to plotly.express.choropleth
+        (color, labels, hover_data, custom_data, ...)
+
+    Returns:
+    --------
+    fig : plotly.graph_objects.Figure
+        The choropleth figure, drawn on the cached county boundaries
+    """
+    fig = px.choropleth(
+        data_frame,
+        geojson=_load_county_geojson(),
+        locations='county_fips',
+        scope="usa",
+        **kwargs
+    )
+
+    # Hide county borders
+    fig.update_traces(marker_line_width=0)
+
+    # Configure the map layout
+    fig.update_geos(
+        visible=False,
+        scope="usa",
+        showcoastlines=True,
+        projection_type="albers usa"
+    )
+
+    fig.update_layout(
+        height=800,
+        title=dict(
+            text=title,
+            automargin=True,
+            y=0.95  # Adjust vertical position
+        ),
+        margin=dict(t=100, b=50, l=50, r=50),
+        autosize=True,
+    )
+
+    return fig
 
 
 def plot_nri_score(county_fips):
@@ -132,12 +325,7 @@ def plot_climate_hazards(county_fips, county_name):
     hazards_df = hazards_df.sort_values("Risk Score", ascending=False)
 
     # Create a color mapping based on risk score ranges
-    hazards_df['Color Category'] = pd.cut(
-        hazards_df['Risk Score'],
-        bins=[0, 20, 40, 60, 80, 100],
-        labels=RISK_LEVELS,
-        include_lowest=True,
-    )
+    hazards_df['Color Category'] = _risk_levels(hazards_df['Risk Score'])
 
     # Create a horizontal bar chart
     fig = px.bar(
@@ -154,366 +342,308 @@ def plot_climate_hazards(county_fips, county_name):
     st.plotly_chart(fig)
 
 
-def plot_nri_choropleth():
-    try:
-        # Get county data
-        county_data = database.get_county_geometries()
-        
-        # Get FEMA risk data
-        fema_data = database.get_stat_var(Table.COUNTY_FEMA_DATA, "fema_nri",
-                                        county_fips=county_data['county_fips'].tolist(), year=2023).reset_index()
-        
-        # Merge the basic county data with the FEMA NRI data
-        merged_df = pd.merge(fema_data, county_data, on='county_fips', how='left')
-
-        # Convert WKT to geometry objects with error handling
-        merged_df['geometry'] = merged_df['geometry'].apply(
-            lambda x: wkt.loads(x) if isinstance(x, str) else x)
-
-        # Create NRI risk buckets
-        merged_df['nri_bucket'] = pd.cut(
-            merged_df['fema_nri'],
-            bins=[0, 20, 40, 60, 80, 100],
-            include_lowest=True,
-            labels=RISK_LEVELS,
-            ordered=True
-        )
-        
-        # Create GeoDataFrame first (needed for proper GeoSeries)
-        gdf = gpd.GeoDataFrame(merged_df)
-
-        # Now simplify the geometry (this is a GeoSeries method)
-        gdf['geometry'] = gdf['geometry'].simplify(tolerance=0.001)
-
-        # Convert to GeoJSON format for Plotly
-        geojson_data = json.loads(gdf.to_json())
-
-        # Create choropleth base layer with county boundaries
-        fig = px.choropleth(
-            gdf,
-            geojson=geojson_data,
-            color='nri_bucket',
-            color_discrete_map=RISK_COLOR_MAPPING,
-            locations=gdf.index,
-            scope="usa",
-            basemap_visible=True,
-            custom_data=['name', 'fema_nri'],
-        )
+@st.cache_resource(show_spinner=False)
+def _nri_choropleth_figure():
+    """Build the FEMA NRI choropleth once per process; it does not depend on any selection."""
+    # Get county data (geometries are parsed and simplified once per process)
+    county_data = _load_county_gdf()
 
-        # Update hover template to format the display nicely
-        fig.update_traces(
-            showlegend=False,
-            hovertemplate='<b>%{customdata[0]}</b><br>' +
-            'FEMA Risk Level: %{customdata[1]:.1f}<br>' +
-            '<extra></extra>',  # Removes trace name from hover
-            marker_line_width=0
-        )
-        for label, color in RISK_COLOR_MAPPING.items():
-            fig.add_trace(
-                go.Scatter(
-
-                    x=[None],
-                    y=[None],
-                    mode='markers',
-                    marker=dict(
-                        size=10,
-                        color=color
-                    ),
-                    name=label,
-                    legendgrouptitle=dict(
-                        text='Hazard Risk Level'
-                    ),
-                    legendgroup='manual_nri_legend',
-                    showlegend=True,
-                    hoverinfo='none'
-                )
-            )
+    # Get FEMA risk data for every county in one cached query, rather than
+    # hashing and binding the full list of county FIPS codes on each rerun
+    fema_data = database.get_stat_var(Table.COUNTY_FEMA_DATA, "fema_nri",
+                                      county_fips=None, year=2023).reset_index()
 
-        fig.update_geos(
-            visible=False,
-            scope="usa",
-            showcoastlines=True,
-            projection_type="albers usa"
-        )
+    # Merge the basic county data with the FEMA NRI data
+    merged_df = pd.merge(fema_data, county_data[['county_fips', 'name']],
+                         on='county_fips', how='inner')
 
-        fig.update_layout(
-            height=800,
-            title=dict(
-                text="Natural Hazard Risk Index Across Counties in the US",
-                automargin=True,
-                y=0.95  # Adjust vertical position
-            ),
-            coloraxis_colorbar=dict(
-                title="NRI Score"
+    # Single precision is plenty for a map color and a %.1f tooltip, and
+    # halves the size of the serialized figure
+    merged_df['fema_nri'] = merged_df['fema_nri'].astype('float32')
+
+    # Create NRI risk buckets
+    merged_df['nri_bucket'] = _risk_levels(merged_df['fema_nri'])
+
+    # Create choropleth base layer with county boundaries
+    fig = _county_choropleth(
+        merged_df,
+        title="Natural Hazard Risk Index Across Counties in the US",
+        color='nri_bucket',
+        color_discrete_map=RISK_COLOR_MAPPING,
+        basemap_visible=True,
+        custom_data=['name', 'fema_nri'],
+    )
+
+    # Update hover template to format the display nicely
+    fig.update_traces(
+        showlegend=False,
+        hovertemplate='<b>%{customdata[0]}</b><br>' +
+        'FEMA Risk Level: %{customdata[1]:.1f}<br>' +
+        '<extra></extra>',  # Removes trace name from hover
+    )
+    # Add the manual legend entries in a single call, so plotly validates and
+    # rebuilds the figure's trace tuple once instead of once per risk level
+    fig.add_traces([
+        go.Scatter(
+            x=[None],
+            y=[None],
+            mode='markers',
+            marker=dict(
+                size=10,
+                color=color
             ),
-            margin=dict(t=100, b=50, l=50, r=50),
-            autosize=True,
-            xaxis=dict(
-                visible=False,
-                showgrid=False
+            name=label,
+            legendgrouptitle=dict(
+                text='Hazard Risk Level'
             ),
-            yaxis=dict(
-                visible=False,
-                showgrid=False
-            )
+            legendgroup='manual_nri_legend',
+            showlegend=True,
+            hoverinfo='none'
         )
+        for label, color in RISK_COLOR_MAPPING.items()
+    ])
 
-        event = st.plotly_chart(fig,
-                                on_select="ignore",
-                                selection_mode=["points"],
-                                config=choropleth_config
-                                )
-
-        return event
-    except Exception as e:
-        st.error(f"Could not create map: {e}")
-        print(f"Could not connect to url or create map.\n{e}")
-        return None
-    
-def receiver_places_choropleth():
-    try:
-        # Get receiver places data
-        receiver_places_data = database.get_receiver_places()
-        
-        county_data = database.get_county_geometries()
-        
-        merged_df = pd.merge(receiver_places_data, county_data, on='county_fips', how='left')
-
-        # Convert WKT to geometry objects with error handling
-        merged_df['geometry'] = merged_df['geometry'].apply(
-            lambda x: wkt.loads(x) if isinstance(x, str) else x)
-
-        # Create GeoDataFrame first (needed for proper GeoSeries)
-        gdf = gpd.GeoDataFrame(merged_df)
-
-        # Now simplify the geometry (this is a GeoSeries method)
-        gdf['geometry'] = gdf['geometry'].simplify(tolerance=0.001)
-
-        # Convert to GeoJSON format for Plotly
-        geojson_data = json.loads(gdf.to_json())
-        
-        # Define discrete color mapping for is_receiving_county
-        color_discrete_map = {
-            "No": "rgb(230, 230, 230)",
-            "Maybe": DIVERGING_RGB[1],
-            "Yes": DIVERGING_RGB[0]
-        }
-        
-        # Create choropleth map using discrete colors
-        fig = px.choropleth(
-            gdf,
-            geojson=geojson_data,
-            color='is_receiving_county',
-            color_discrete_map=color_discrete_map,
-            locations=merged_df.index,
-            scope="usa",
-            labels={
-                'is_receiving_county': 'Receiving County'
-            },
-            hover_data={
-                'name': True,
-                'is_receiving_county': True,
-            },
-            title="Climate Migration Receiver Places"
-        )
-        
-        # Update hover template
-        fig.update_traces(
-            hovertemplate='<b>%{customdata[0]}</b><br>' +
-            'Receiver place: %{customdata[1]}<br>' +
-            '<extra></extra>',
-            marker_line_width=0
-        )
-        
-        # Configure the map layout
-        fig.update_geos(
+    fig.update_layout(
+        coloraxis_colorbar=dict(
+            title="NRI Score"
+        ),
+        xaxis=dict(
             visible=False,
-            scope="usa",
-            showcoastlines=True,
-            projection_type="albers usa"
-        )
-        
-        fig.update_layout(
-            height=800,
-            title=dict(
-                text="PLACE Initiative - Receiver Places",
-                automargin=True,
-                y=0.95
-            ),
-            margin=dict(t=100, b=50, l=50, r=50),
-            autosize=True,
-            legend=dict(
-                title="County is a receiver place?",
-                orientation="v",
-                yanchor="top",
-                y=0.9,
-                xanchor="left",
-                x=1.01
-            )
+            showgrid=False
+        ),
+        yaxis=dict(
+            visible=False,
+            showgrid=False
         )
-        
-        # Display the chart
-        event = st.plotly_chart(fig,
-                                on_select="ignore",
-                                selection_mode=["points"],
-                                config=choropleth_config
-                                )
-        
-        return event
-        
-    except Exception as e:
-        st.error(f"Could not create receiver places map: {e}")
-        print(f"Could not create receiver places map.\\n{e}")
-        return None
-    
+    )
 
-def population_by_climate_region(scenario):
+    return fig
+
+
+def _figure_html(fig):
     """
-    Display a choropleth map of population by county for a given scenario.
+    Serialize a figure into a standalone HTML snippet.
 
     Parameters:
     -----------
-    scenario : str
-        The column name for the population scenario to display (e.g., 'POPULATION_2065_S5a')
-    db_conn : connection object, optional
-        Database connection object
+    fig : plotly.graph_objects.Figure
+        Figure to serialize
 
     Returns:
     --------
-    event : Streamlit event object
-        The plotly chart event object
+    html : str
+        A div and script that draw the figure with plotly.js
+    height : int
+        Height in pixels to reserve for the figure
     """
+    html = fig.to_html(full_html=False, include_plotlyjs='cdn',
+                       config=dict(choropleth_config, responsive=True))
+
+    return html, (fig.layout.height or 450) + 20
+
+
+@st.cache_resource(show_spinner=False)
+def _nri_choropleth_html():
+    """Serialize the NRI choropleth once per process."""
+    return _figure_html(_nri_choropleth_figure())
+
+
+def plot_nri_choropleth():
     try:
-        # Get county data and merge with population projections
-        counties_data = database.get_county_metadata()
-        population_data = database.get_population_projections_by_fips()
-        counties_data = counties_data.merge(
-            population_data,
-            how='inner',
-            on='county_fips'
+        # The map does not depend on any selection, so send the cached
+        # serialization instead of re-encoding every county polygon per rerun
+        html, height = _nri_choropleth_html()
+
+        components.html(html, height=height)
+    except Exception as e:
+        st.error(f"Could not create map: {e}")
+        print(f"Could not connect to url or create map.\n{e}")
+        return None
+    
+@st.cache_resource(show_spinner=False)
+def _receiver_places_figure():
+    """Build the receiver places choropleth once per process."""
+    # Get receiver places data
+    receiver_places_data = database.get_receiver_places()
+
+    county_data = _load_county_gdf()
+
+    merged_df = pd.merge(receiver_places_data, county_data[['county_fips', 'name']],
+                         on='county_fips', how='left')
+
+    # Define discrete color mapping for is_receiving_county
+    color_discrete_map = {
+        "No": "rgb(230, 230, 230)",
+        "Maybe": DIVERGING_RGB[1],
+        "Yes": DIVERGING_RGB[0]
+    }
+
+    # Create choropleth map using discrete colors
+    fig = _county_choropleth(
+        merged_df,
+        title="PLACE Initiative - Receiver Places",
+        color='is_receiving_county',
+        color_discrete_map=color_discrete_map,
+        labels={
+            'is_receiving_county': 'Receiving County'
+        },
+        hover_data={
+            'name': True,
+            'is_receiving_county': True,
+        },
+    )
+
+    # Update hover template
+    fig.update_traces(
+        hovertemplate='<b>%{customdata[0]}</b><br>' +
+        'Receiver place: %{customdata[1]}<br>' +
+        '<extra></extra>',
+    )
+
+    fig.update_layout(
+        legend=dict(
+            title="County is a receiver place?",
+            orientation="v",
+            yanchor="top",
+            y=0.9,
+            xanchor="left",
+            x=1.01
         )
+    )
 
-        # Convert WKT to geometry objects
-        counties_data['geometry'] = counties_data['geometry'].apply(wkt.loads)
+    return fig
 
-        # Get centroids of geometries for marker placement
-        counties_data['centroid_lon'] = counties_data['geometry'].apply(
-            lambda geom: geom.centroid.x)
-        counties_data['centroid_lat'] = counties_data['geometry'].apply(
-            lambda geom: geom.centroid.y)
 
-        # Calculate variation between scenario and baseline
-        counties_data['variation'] = counties_data[scenario] - \
-            counties_data['population_2065_s3']
+@st.cache_resource(show_spinner=False)
+def _receiver_places_html():
+    """Serialize the receiver places choropleth once per process."""
+    return _figure_html(_receiver_places_figure())
 
-        # Percentage difference
-        counties_data['variation_pct'] = ((counties_data[scenario] - counties_data['population_2065_s3']) /
-                                          counties_data['population_2065_s3']) * 100
 
-        # Convert to GeoDataFrame for spatial operations
-        counties_data = gpd.GeoDataFrame(counties_data)
+def receiver_places_choropleth():
+    try:
+        html, height = _receiver_places_html()
 
-        # Convert to GeoDataFrame for spatial operations
-        gdf = gpd.GeoDataFrame(counties_data)
+        components.html(html, height=height)
+    except Exception as e:
+        st.error(f"Could not create receiver places map: {e}")
+        print(f"Could not create receiver places map.\\n{e}")
+        return None
+    
 
-        # Now simplify the geometry (this is a GeoSeries method)
-        gdf['geometry'] = gdf['geometry'].simplify(tolerance=0.001)
+@st.cache_resource(show_spinner=False)
+def _population_change_figure(scenario):
+    """Build the population change choropleth for a scenario, cached per scenario."""
+    # Get county geometries and merge with population projections
+    population_data = database.get_population_projections_by_fips()
+    counties_data = _load_county_gdf().merge(
+        population_data,
+        how='inner',
+        on='county_fips'
+    )
 
-        # Convert to GeoJSON format for Plotly
-        counties_geojson = json.loads(gdf.to_json())
+    # Calculate variation between scenario and baseline
+    counties_data['variation'] = counties_data[scenario] - \
+        counties_data['population_2065_s3']
 
-        # Extract the state FIPS from county FIPS (first 2 digits)
-        gdf['county_fips'] = gdf['county_fips'].astype(str)
-        gdf['state_fips'] = gdf['county_fips'].str[:2]
+    # Percentage difference
+    counties_data['variation_pct'] = ((counties_data[scenario] - counties_data['population_2065_s3']) /
+                                      counties_data['population_2065_s3']) * 100
 
-        # Find the maximum absolute percentage change for symmetric color scale
-        max_abs_pct_change = max(
-            abs(gdf['variation_pct'].min()),
-            abs(gdf['variation_pct'].max())
-        )
+    # Downcast the plotted columns so the serialized figure stays small
+    counties_data[['variation', 'variation_pct']] = \
+        counties_data[['variation', 'variation_pct']].astype('float32')
+    counties_data[scenario] = pd.to_numeric(
+        counties_data[scenario], downcast='integer')
 
-        # Create choropleth base layer with county population data
-        fig = px.choropleth(
-            gdf,
-            geojson=counties_geojson,
-            color='variation_pct',
-            color_continuous_scale=DIVERGING_RGB,  # Red-Blue diverging scale
-            range_color=[-max_abs_pct_change,
-                         max_abs_pct_change],  # Symmetric scale
-            locations=gdf.index,
-            scope="usa",
-            labels={
-                'county_name': 'County',
-                scenario: 'Population (2065)',
-                'variation_pct': 'Population Change (%)'
-            },
-            basemap_visible=False,
-            hover_data={
-                'county_name': True,
-                scenario: True,
-                'variation_pct': ':.2f',
-                'county_fips': False  # Hide FIPS code from hover
-            },
-            custom_data=['county_name', scenario, 'variation_pct']
-        )
+    # Find the maximum absolute percentage change for symmetric color scale
+    max_abs_pct_change = max(
+        abs(counties_data['variation_pct'].min()),
+        abs(counties_data['variation_pct'].max())
+    )
 
-        # Update hover template to format the display nicely
-        fig.update_traces(
-            hovertemplate='<b>%{customdata[0]}</b><br>' +
-            'Population (2065): %{customdata[1]:,.0f}<br>' +
-            'Change from Baseline: %{customdata[2]:.2f}%<br>' +
-            '<extra></extra>',  # Removes trace name from hover
-            marker_line_width=0
+    # Impact labels based on the human-readable scenario parameter
+    scenario_labels = {
+        'population_2065_s5a': 'Low Impact Climate Migration',
+        'population_2065_s5b': 'Medium Impact Climate Migration',
+        'population_2065_s5c': 'High Impact Climate Migration'
+    }
 
-        )
+    scenario_title = scenario_labels.get(scenario, scenario)
+
+    # Create choropleth base layer with county population data
+    fig = _county_choropleth(
+        counties_data,
+        title=f"Effect of Climate Migration on 2065 Population Projections<br><sub>{scenario_title}</sub>",
+        color='variation_pct',
+        color_continuous_scale=DIVERGING_RGB,  # Red-Blue diverging scale
+        range_color=[-max_abs_pct_change,
+                     max_abs_pct_change],  # Symmetric scale
+        labels={
+            'county_name': 'County',
+            scenario: 'Population (2065)',
+            'variation_pct': 'Population Change (%)'
+        },
+        basemap_visible=False,
+        hover_data={
+            'county_name': True,
+            scenario: True,
+            'variation_pct': ':.2f',
+            'county_fips': False  # Hide FIPS code from hover
+        },
+        custom_data=['county_name', scenario, 'variation_pct']
+    )
 
+    # Update hover template to format the display nicely
+    fig.update_traces(
+        hovertemplate='<b>%{customdata[0]}</b><br>' +
+        'Population (2065): %{customdata[1]:,.0f}<br>' +
+        'Change from Baseline: %{customdata[2]:.2f}%<br>' +
+        '<extra></extra>',  # Removes trace name from hover
+    )
 
-        # Configure the map layout
-        fig.update_geos(
-            visible=False,
-            scope="usa",
-            showcoastlines=True,
-            projection_type="albers usa"
-        )
+    # Update colorbar title
+    fig.update_coloraxes(
+        colorbar_title="Population<br>Change (%)",
+        colorbar_title_font_size=12,
+        colorbar_title_side="right"
+    )
 
-        # Update colorbar title
-        fig.update_coloraxes(
-            colorbar_title="Population<br>Change (%)",
-            colorbar_title_font_size=12,
-            colorbar_title_side="right"
-        )
+    fig.update_layout(
+        legend=dict(
+            title="",
+            itemsizing="constant",
+            groupclick="toggleitem",
+            tracegroupgap=20,  # Add space between legend groups
+            yanchor="top",
+            y=0.9,
+            xanchor="left",
+            x=1.01,
+            orientation="v"
+        ),
+    )
 
-        # Impact labels based on the human-readable scenario parameter
-        scenario_labels = {
-            'population_2065_s5a': 'Low Impact Climate Migration',
-            'population_2065_s5b': 'Medium Impact Climate Migration',
-            'population_2065_s5c': 'High Impact Climate Migration'
-        }
+    return fig
 
-        scenario_title = scenario_labels.get(scenario, scenario)
 
-        fig.update_layout(
-            height=800,
-            title=dict(
-                text=f"Effect of Climate Migration on 2065 Population Projections<br><sub>{scenario_title}</sub>",
-                automargin=True,
-                y=0.95  # Adjust vertical position
-            ),
-            legend=dict(
-                title="",
-                itemsizing="constant",
-                groupclick="toggleitem",
-                tracegroupgap=20,  # Add space between legend groups
-                yanchor="top",
-                y=0.9,
-                xanchor="left",
-                x=1.01,
-                orientation="v"
-            ),
-            margin=dict(t=100, b=50, l=50, r=50),
-            autosize=True,
-        )
+def population_by_climate_region(scenario):
+    """
+    Display a choropleth map of population by county for a given scenario.
+
+    Parameters:
+    -----------
+    scenario : str
+        The column name for the population scenario to display (e.g., 'POPULATION_2065_S5a')
+    db_conn : connection object, optional
+        Database connection object
 
+    Returns:
+    --------
+    event : Streamlit event object
+        The plotly chart event object
+    """
+    try:
+        fig = _population_change_figure(scenario)
 
         event = st.plotly_chart(
             fig,
@@ -546,7 +676,6 @@ def plot_socioeconomic_indices(df, title=None):
     fig : plotly.graph_objects.Figure
         The plotly figure object that can be displayed with st.plotly_chart()
     """
-    import plotly.graph_objects as go
 
     # Create color palette with shades of #509BC7
     base_color = "#509BC7"
@@ -557,8 +686,9 @@ def plot_socioeconomic_indices(df, title=None):
         "#3E7A9E",  # Dark shade
     ]
 
-    # Get the list of years for the x-axis
-    years = sorted(df['Year'].unique())
+    # Sort once and hand plotly plain arrays, rather than re-sorting per trace
+    sorted_df = df.sort_values('Year')
+    years = sorted_df['Year'].to_numpy()
 
     # Get the index columns (columns that start with 'socioeconomic_index_')
     index_columns = [col for col in df.columns if col.startswith(
@@ -577,7 +707,7 @@ def plot_socioeconomic_indices(df, title=None):
         fig.add_trace(
             go.Scatter(
                 x=years,
-                y=df.sort_values('Year')[column],
+                y=sorted_df[column].to_numpy(),
                 mode='lines+markers',
                 name=display_name,
                 line=dict(color=colors[i % len(colors)], width=3),
@@ -631,7 +761,6 @@ def plot_socioeconomic_radar(df, selected_years=None):
     fig : plotly.graph_objects.Figure
         The plotly radar chart
     """
-    import plotly.graph_objects as go
 
     # Get all available years
     years = sorted(df['Year'].unique())
@@ -655,12 +784,15 @@ def plot_socioeconomic_radar(df, selected_years=None):
     # Create figure
     fig = go.Figure()
 
+    # Index the first row of each year once, instead of filtering the frame
+    # and pulling each value out with .values[0] for every selected year
+    index_values_by_year = df.drop_duplicates('Year').set_index('Year')[index_columns]
+
     # Add traces for each selected year
     for i, year in enumerate(selected_years):
-        year_data = df[df['Year'] == year]
-        if not year_data.empty:
+        if year in index_values_by_year.index:
             fig.add_trace(go.Scatterpolar(
-                r=[year_data[col].values[0] for col in index_columns],
+                r=index_values_by_year.loc[year].to_numpy(),
                 theta=categories,
                 fill='toself',
                 name=f'Year {year}',
@@ -840,8 +972,9 @@ def display_scenario_impact_analysis(county_name, state_name, projected_data):
         st.plotly_chart(employment_chart, use_container_width=True)
 
         # Add interpretation based on the data
-        unemployment_above_threshold = any(
-            100 - row['total_employed_percentage'] > 4.0 for _, row in projected_data.iterrows())
+        unemployment_rate = 100 - \
+            projected_data['total_employed_percentage'].to_numpy()
+        unemployment_above_threshold = bool((unemployment_rate > 4.0).any())
 
         if unemployment_above_threshold:
             st.warning(
@@ -863,8 +996,8 @@ def display_scenario_impact_analysis(county_name, state_name, projected_data):
         st.plotly_chart(education_chart, use_container_width=True)
 
         # Add interpretation based on the data
-        high_ratio_scenarios = [row['scenario'] for _, row in projected_data.iterrows(
-        ) if row['student_teacher_ratio'] > 16.0]
+        high_ratio_mask = projected_data['student_teacher_ratio'].to_numpy() > 16.0
+        high_ratio_scenarios = projected_data.loc[high_ratio_mask, 'scenario'].tolist()
 
         if high_ratio_scenarios:
             st.warning(
@@ -885,153 +1018,226 @@ def display_scenario_impact_analysis(county_name, state_name, projected_data):
         housing_chart = create_housing_chart(projected_data)
         st.plotly_chart(housing_chart, use_container_width=True)
 
-        # Calculate and add interpretation
-        for _, row in projected_data.iterrows():
-            occupancy_rate = (row['occupied_housing_units'] / (
-                row['occupied_housing_units'] + row['available_housing_units'])) * 100
-            vacancy_rate = 100 - occupancy_rate
-
-            if vacancy_rate < 5:
+        # Add interpretation
+        for scenario, rate in zip(projected_data['scenario'].tolist(),
+                                  projected_data['vacancy_rate'].to_numpy()):
+            if rate < 5:
                 st.warning(
-                    f"In the {row['scenario']} scenario, the vacancy rate is below 5%, indicating a potential housing shortage.")
-            elif vacancy_rate > 8:
+                    f"In the {scenario} scenario, the vacancy rate is below 5%, indicating a potential housing shortage.")
+            elif rate > 8:
                 st.info(
-                    f"In the {row['scenario']} scenario, the vacancy rate is above 8%, suggesting potential excess housing capacity.")
+                    f"In the {scenario} scenario, the vacancy rate is above 8%, suggesting potential excess housing capacity.")
 
 
-def create_housing_chart(projected_data):
-    # Make a copy of the dataframe to avoid modifying the original
-    df = projected_data.copy()
+def _threshold_layout(*thresholds):
+    """
+    Build layout shapes and labels for horizontal threshold lines.
 
-    # Sort the dataframe by scenario
-    df = df.sort_values('scenario')
+    The lines span the full plot width in paper coordinates, so they do not
+    depend on a chart's data and can be shared by every figure.
 
-    # Get the max absolute value for symmetric axis
-    max_value = max(abs(df['available_housing_units'].max()),
-                    abs(df['available_housing_units'].min()))
+    Parameters:
+    -----------
+    *thresholds : tuple
+        (y, label, color, width) for each line
 
-    # Calculate housing metrics if not already in the dataframe
-    if 'housing_occupancy_rate' not in df.columns:
-        df['housing_occupancy_rate'] = (df['occupied_housing_units'] / (
-            df['occupied_housing_units'] + df['available_housing_units'])) * 100
+    Returns:
+    --------
+    dict
+        "shapes" and "annotations" entries to pass to fig.update_layout
+    """
+    return dict(
+        shapes=[
+            dict(type="line", xref="paper", x0=0, x1=1, y0=y, y1=y,
+                 line=dict(color=color, dash="dash", width=width), name=label)
+            for y, label, color, width in thresholds
+        ],
+        annotations=[
+            dict(xref="paper", x=1, y=y, text=label, showarrow=False,
+                 yshift=10, xshift=20, font=dict(color=color))
+            for y, label, color, width in thresholds
+        ],
+    )
 
-    # Create the horizontal bar chart
-    fig = go.Figure()
 
-    fig.add_trace(go.Bar(
-        y=df['scenario'],
-        x=df['available_housing_units'],
+# Threshold lines for the county time series charts
+RENT_BURDEN_THRESHOLDS = _threshold_layout(
+    (30, "30% Burden", DIVERGING_RGB[3], 4),
+    (50, "50% Burden", DIVERGING_RGB[4], 4),
+)
+VACANCY_THRESHOLDS = _threshold_layout(
+    (7, "7% Threshold", DIVERGING_RGB[3], 4),
+)
+NAIRU_THRESHOLDS = _threshold_layout(
+    (4, "NAIRU Threshold", DIVERGING_RGB[3], 2),
+)
+
+# Optimal student-teacher ratio line across the whole scenario axis
+STUDENT_TEACHER_THRESHOLD_LINE = dict(
+    type="line",
+    xref="paper",
+    x0=0,
+    x1=1,
+    y0=16.0,  # National average is around 16:1
+    y1=16.0,
+    line=dict(
+        color="gray",
+        width=2,
+        dash="dash",
+    ),
+)
+
+
+# Static layout for the scenario charts; the builders only fill in the
+# data-dependent axis settings. plotly copies these while validating, so the
+# shared dicts are never mutated.
+HOUSING_CHART_LAYOUT = dict(
+    title="Projected Available Housing Units by Scenario in 2065",
+    xaxis=dict(
+        title="Available Housing Units in 2065",
+        zeroline=True,
+        zerolinecolor='black',
+        zerolinewidth=1
+    ),
+    yaxis=dict(
+        title="Scenario",
+        autorange="reversed"  # To have the largest value at the top
+    ),
+    height=500,
+    margin=dict(l=100, r=20, t=70, b=70),
+    template="plotly_white",
+)
+
+STUDENT_TEACHER_CHART_LAYOUT = dict(
+    title='Projected Student-Teacher Ratio by Scenario',
+    xaxis=dict(
+        title='Scenario',
+        tickmode='array',
+    ),
+    yaxis=dict(
+        title='Student-Teacher Ratio',
+    ),
+    margin=dict(l=50, r=50, t=80, b=50),
+    height=400,
+)
+
+EMPLOYMENT_CHART_LAYOUT = dict(
+    title='Projected Employment by Scenario',
+    barmode='stack',
+    xaxis=dict(
+        title='Percentage (%)',
+        range=[0, 100],
+        tickvals=[0, 20, 40, 60, 80, 100],
+        ticktext=['0%', '20%', '40%', '60%', '80%', '100%']
+    ),
+    yaxis=dict(
+        title='Scenario',
+        categoryorder='array',
+    ),
+    legend=dict(
         orientation='h',
-        marker=dict(
-            color=df['available_housing_units'].apply(
-                lambda x: DIVERGING_RGB[3] if x < 0 else DIVERGING_RGB[0]),
-        )
-    ))
+        yanchor='bottom',
+        y=1.02,
+        xanchor='right',
+        x=1
+    ),
+    margin=dict(l=50, r=50, t=80, b=50),
+    height=400,
+)
 
-    # Update layout for better appearance
-    fig.update_layout(
-        title="Projected Available Housing Units by Scenario in 2065",
-        xaxis=dict(
-            title="Available Housing Units in 2065",
-            range=[-max_value, max_value],  # Symmetric x-axis
-            zeroline=True,
-            zerolinecolor='black',
-            zerolinewidth=1
-        ),
-        yaxis=dict(
-            title="Scenario",
-            autorange="reversed"  # To have the largest value at the top
-        ),
-        height=500,
-        margin=dict(l=100, r=20, t=70, b=70),
-        template="plotly_white"
-    )
 
-    # Adding a vertical reference line at x=0
-    fig.add_shape(
-        type="line",
-        x0=0, y0=-0.5,
-        x1=0, y1=len(df) - 0.5,
-        line=dict(color="black", width=1, dash="solid")
+@st.cache_resource(show_spinner=False, max_entries=128)
+def create_housing_chart(projected_data):
+    # Rows arrive ordered by scenario from get_combined_projections
+    df = projected_data
+
+    available_units = df['available_housing_units'].to_numpy()
+
+    # Get the max absolute value for symmetric axis
+    max_value = np.abs(available_units).max()
+
+    # Create the horizontal bar chart from plain dicts in a single constructor
+    # call, so plotly validates the whole figure in one pass
+    fig = go.Figure(
+        data=[dict(
+            type='bar',
+            y=df['scenario'],
+            x=available_units,
+            orientation='h',
+            marker=dict(
+                color=np.where(available_units < 0,
+                               DIVERGING_RGB[3], DIVERGING_RGB[0]),
+            )
+        )],
+        layout=dict(
+            HOUSING_CHART_LAYOUT,
+            xaxis=dict(
+                HOUSING_CHART_LAYOUT['xaxis'],
+                range=[-max_value, max_value],  # Symmetric x-axis
+            ),
+            # Vertical reference line at x=0
+            shapes=[dict(
+                type="line",
+                x0=0, y0=-0.5,
+                x1=0, y1=len(df) - 0.5,
+                line=dict(color="black", width=1, dash="solid")
+            )],
+        )
     )
 
-    # Display the chart
     return fig
 
 
+@st.cache_resource(show_spinner=False, max_entries=128)
 def create_student_teacher_chart(projected_data):
-    # Make a copy of the dataframe to avoid modifying the original
-    df = projected_data.copy()
+    # Rows arrive ordered by scenario from get_combined_projections
+    df = projected_data
 
-    # Sort the dataframe by scenario
-    df = df.sort_values('scenario')
+    # Optimal student-teacher ratio threshold
+    optimal_ratio = STUDENT_TEACHER_THRESHOLD_LINE['y0']
 
-    # Create figure
-    fig = go.Figure()
+    ratios = df['student_teacher_ratio'].to_numpy(dtype=float)
+    n_scenarios = len(df)
 
-    # Define the optimal student-teacher ratio threshold
-    optimal_ratio = 16.0  # National average is around 16:1
-
-    # Add bar for each scenario
-    fig.add_trace(
-        go.Bar(
+    # Create the figure from plain dicts in a single constructor call
+    fig = go.Figure(
+        data=[dict(
+            type='bar',
             x=df['scenario'],
-            y=df['student_teacher_ratio'],
+            y=ratios,
             marker=dict(
-                color=[
-                    DIVERGING_RGB[3] if ratio > optimal_ratio else DIVERGING_RGB[0]
-                    for ratio in df['student_teacher_ratio']
-                ]
+                color=np.where(ratios > optimal_ratio,
+                               DIVERGING_RGB[3], DIVERGING_RGB[0])
             ),
-            text=[f"{ratio:.1f}" for ratio in df['student_teacher_ratio']],
+            text=np.char.mod('%.1f', ratios),
             textposition='auto',
             hovertemplate='Student-Teacher Ratio: %{y:.1f}<extra></extra>'
+        )],
+        layout=dict(
+            STUDENT_TEACHER_CHART_LAYOUT,
+            xaxis=dict(
+                STUDENT_TEACHER_CHART_LAYOUT['xaxis'],
+                tickvals=list(range(n_scenarios)),
+                ticktext=df['scenario']
+            ),
+            yaxis=dict(
+                STUDENT_TEACHER_CHART_LAYOUT['yaxis'],
+                range=[0, ratios.max() * 1.2]  # Add some padding
+            ),
+            shapes=[STUDENT_TEACHER_THRESHOLD_LINE],
+            # Annotation for the threshold
+            annotations=[dict(
+                x=n_scenarios - 1,
+                y=optimal_ratio + 0.5,
+                text="Optimal Ratio (16:1)",
+                showarrow=False,
+                font=dict(
+                    color="gray"
+                )
+            )],
         )
     )
 
-    # Add threshold line
-    fig.add_shape(
-        type="line",
-        x0=-0.5,
-        y0=optimal_ratio,
-        x1=len(df) - 0.5,
-        y1=optimal_ratio,
-        line=dict(
-            color="gray",
-            width=2,
-            dash="dash",
-        ),
-    )
-
-    # Add annotation for the threshold
-    fig.add_annotation(
-        x=len(df) - 1,
-        y=optimal_ratio + 0.5,
-        text="Optimal Ratio (16:1)",
-        showarrow=False,
-        font=dict(
-            color="gray"
-        )
-    )
-
-    # Update layout
-    fig.update_layout(
-        title='Projected Student-Teacher Ratio by Scenario',
-        xaxis=dict(
-            title='Scenario',
-            tickmode='array',
-            tickvals=list(range(len(df))),
-            ticktext=df['scenario']
-        ),
-        yaxis=dict(
-            title='Student-Teacher Ratio',
-            range=[0, max(df['student_teacher_ratio'])
-                   * 1.2]  # Add some padding
-        ),
-        margin=dict(l=50, r=50, t=80, b=50),
-        height=400,
-    )
-
     return fig
 
 
@@ -1039,101 +1245,73 @@ def format_percentage(percentage):
     return f"{percentage:.1f}%"
 
 
+@st.cache_resource(show_spinner=False, max_entries=128)
 def create_employment_chart(projected_data):
-    # Make a copy of the dataframe to avoid modifying the original
-    df = projected_data.copy()
-
-    # Calculate the unemployed percentage for each scenario
-    df['unemployed_percentage'] = 100 - df['total_employed_percentage']
-
-    # Sort the dataframe by scenario
-    df = df.sort_values('scenario', ascending=False)
+    # Calculate the unemployed percentage for each scenario (assign returns a
+    # new frame) and reverse the upstream scenario order for display
+    df = projected_data.assign(
+        unemployed_percentage=100 - projected_data['total_employed_percentage']
+    ).iloc[::-1]
 
     # Define the NAIRU threshold
     nairu_threshold = 4.0
 
-    # Create figure with secondary y-axis
-    fig = make_subplots(specs=[[{"secondary_y": True}]])
-
-    # Add traces for employed and unemployed percentages
-    for index, row in df.iterrows():
-        # Determine color for unemployed percentage bar
-        unemployed_color = DIVERGING_RGB[3] if row['unemployed_percentage'] > nairu_threshold else DIVERGING_RGB[2]
-
-        # Add employed percentage bar
-        fig.add_trace(
-            go.Bar(
+    # Color each unemployed bar by whether it exceeds the NAIRU threshold
+    unemployed_colors = np.where(
+        df['unemployed_percentage'].to_numpy() > nairu_threshold,
+        DIVERGING_RGB[3], DIVERGING_RGB[2])
+    employed_text = df['total_employed_percentage'].map(format_percentage)
+    unemployed_text = df['unemployed_percentage'].map(format_percentage)
+
+    # Create the figure from plain dicts in a single constructor call: one
+    # stacked trace each for employed and unemployed percentages, plus the
+    # NAIRU threshold line
+    fig = go.Figure(
+        data=[
+            dict(
+                type='bar',
                 name='Employed',
-                y=[row['scenario']],
-                x=[row['total_employed_percentage']],
+                y=df['scenario'],
+                x=df['total_employed_percentage'],
                 orientation='h',
                 marker=dict(color=DIVERGING_RGB[0]),
-                text=[format_percentage(row['total_employed_percentage'])],
+                text=employed_text,
                 textposition='inside',
                 hoverinfo='text',
-                hovertext=[
-                    f"Employed: {format_percentage(row['total_employed_percentage'])}"],
-                showlegend=index == 0  # Only show in legend for the first entry
-            )
-        )
-
-        # Add unemployed percentage bar
-        fig.add_trace(
-            go.Bar(
+                hovertext='Employed: ' + employed_text,
+            ),
+            dict(
+                type='bar',
                 name='Unemployed',
-                y=[row['scenario']],
-                x=[row['unemployed_percentage']],
+                y=df['scenario'],
+                x=df['unemployed_percentage'],
                 orientation='h',
-                marker=dict(color=unemployed_color),
-                text=[format_percentage(row['unemployed_percentage'])],
+                marker=dict(color=unemployed_colors),
+                text=unemployed_text,
                 textposition='inside',
                 hoverinfo='text',
-                hovertext=[
-                    f"Unemployed: {format_percentage(row['unemployed_percentage'])}"],
-                showlegend=index == 0  # Only show in legend for the first entry
-            )
+                hovertext='Unemployed: ' + unemployed_text,
+            ),
+            dict(
+                type='scatter',
+                name='NAIRU Threshold (4%)',
+                x=[nairu_threshold],
+                y=df['scenario'],
+                mode='lines',
+                line=dict(color='gray', width=2, dash='dash'),
+                opacity=0.8,
+                hoverinfo='text',
+                hovertext=['NAIRU Threshold: 4%'],
+                showlegend=True
+            ),
+        ],
+        layout=dict(
+            EMPLOYMENT_CHART_LAYOUT,
+            yaxis=dict(
+                EMPLOYMENT_CHART_LAYOUT['yaxis'],
+                categoryarray=df['scenario'].tolist()
+            ),
         )
-
-    # Add NAIRU threshold line
-    fig.add_trace(
-        go.Scatter(
-            name='NAIRU Threshold (4%)',
-            x=[nairu_threshold],
-            y=df['scenario'],
-            mode='lines',
-            line=dict(color='gray', width=2, dash='dash'),
-            opacity=0.8,
-            hoverinfo='text',
-            hovertext=['NAIRU Threshold: 4%'],
-            showlegend=True
-        ),
-        secondary_y=False
-    )
-
-    # Update layout
-    fig.update_layout(
-        title='Projected Employment by Scenario',
-        barmode='stack',
-        xaxis=dict(
-            title='Percentage (%)',
-            range=[0, 100],
-            tickvals=[0, 20, 40, 60, 80, 100],
-            ticktext=['0%', '20%', '40%', '60%', '80%', '100%']
-        ),
-        yaxis=dict(
-            title='Scenario',
-            categoryorder='array',
-            categoryarray=df['scenario'].tolist()
-        ),
-        legend=dict(
-            orientation='h',
-            yanchor='bottom',
-            y=1.02,
-            xanchor='right',
-            x=1
-        ),
-        margin=dict(l=50, r=50, t=80, b=50),
-        height=400,
     )
 
     return fig
@@ -1145,6 +1323,21 @@ def socioeconomic_projections(county_fips):
     st.write(indices_df)
 
 
+# Medium and high impact scenarios, the only ones that produce recommendations
+RECOMMENDATION_SCENARIOS = ['s5b', 's5c']
+
+# Housing issue and recommendation per vacancy rate code, as assigned in
+# generate_policy_recommendations
+HOUSING_RECOMMENDATIONS = [
+    ("Negative vacancy rate of {rate:.1f}% indicates a shortage of housing.",
+     "Implement zoning reforms and incentives for affordable housing development to accommodate projected population growth."),
+    ("Low vacancy rate of {rate:.1f}% indicates potential housing shortage",
+     "Implement zoning reforms and incentives for affordable housing development to accommodate projected population growth."),
+    ("High vacancy rate of {rate:.1f}% indicates potential housing surplus",
+     "Consider adaptive reuse strategies for vacant properties and focus on maintaining existing housing stock quality."),
+]
+
+
 def generate_policy_recommendations(projected_data):
     """Generate policy recommendations based on the projected data"""
     st.write("# Policy Recommendations")
@@ -1153,54 +1346,49 @@ def generate_policy_recommendations(projected_data):
     # Calculate metrics for recommendations
     recommendations = []
 
+    # Only the medium and high impact scenarios produce recommendations
+    scenarios = projected_data['scenario'].to_numpy()
+    in_scope = projected_data['scenario'].isin(
+        RECOMMENDATION_SCENARIOS).to_numpy()
+
     # Check employment metrics
-    for _, row in projected_data.iterrows():
-        unemployment_rate = 100 - row['total_employed_percentage']
-        if unemployment_rate > 4.0 and row['scenario'] in ['S5b', 'S5c']:
-            recommendations.append({
-                'category': 'Employment',
-                'scenario': row['scenario'],
-                'issue': f"Projected unemployment rate of {unemployment_rate:.1f}% exceeds optimal levels",
-                'recommendation': "Consider workforce development programs and economic incentives to attract industries likely to thrive in changing climate conditions."
-            })
+    unemployment_rate = 100 - \
+        projected_data['total_employed_percentage'].to_numpy()
+    flagged = in_scope & (unemployment_rate > 4.0)
+    for scenario, rate in zip(scenarios[flagged], unemployment_rate[flagged]):
+        recommendations.append({
+            'category': 'Employment',
+            'scenario': scenario,
+            'issue': f"Projected unemployment rate of {rate:.1f}% exceeds optimal levels",
+            'recommendation': "Consider workforce development programs and economic incentives to attract industries likely to thrive in changing climate conditions."
+        })
 
     # Check education metrics
-    for _, row in projected_data.iterrows():
-        if row['student_teacher_ratio'] > 16.0 and row['scenario'] in ['S5b', 'S5c']:
-            recommendations.append({
-                'category': 'Education',
-                'scenario': row['scenario'],
-                'issue': f"Student-teacher ratio of {row['student_teacher_ratio']:.1f} exceeds national average",
-                'recommendation': "Plan for educational infrastructure expansion and teacher recruitment to maintain educational quality with population growth."
-            })
-
-    # Check housing metrics
-    for _, row in projected_data.iterrows():
-        occupancy_rate = (row['occupied_housing_units'] / (
-            row['occupied_housing_units'] + row['available_housing_units'])) * 100
-        vacancy_rate = 100 - occupancy_rate
-
-        if vacancy_rate <= 0 and row['scenario'] in ['S5b', 'S5c']:
-            recommendations.append({
-                'category': 'Housing',
-                'scenario': row['scenario'],
-                'issue': f"Negative vacancy rate of {vacancy_rate:.1f}% indicates a shortage of housing.",
-                'recommendation': "Implement zoning reforms and incentives for affordable housing development to accommodate projected population growth."
-            })
-        elif vacancy_rate < 5 and row['scenario'] in ['S5b', 'S5c']:
-            recommendations.append({
-                'category': 'Housing',
-                'scenario': row['scenario'],
-                'issue': f"Low vacancy rate of {vacancy_rate:.1f}% indicates potential housing shortage",
-                'recommendation': "Implement zoning reforms and incentives for affordable housing development to accommodate projected population growth."
-            })
-        elif vacancy_rate > 8 and row['scenario'] in ['S5b', 'S5c']:
-            recommendations.append({
-                'category': 'Housing',
-                'scenario': row['scenario'],
-                'issue': f"High vacancy rate of {vacancy_rate:.1f}% indicates potential housing surplus",
-                'recommendation': "Consider adaptive reuse strategies for vacant properties and focus on maintaining existing housing stock quality."
-            })
+    student_teacher_ratio = projected_data['student_teacher_ratio'].to_numpy()
+    flagged = in_scope & (student_teacher_ratio > 16.0)
+    for scenario, ratio in zip(scenarios[flagged], student_teacher_ratio[flagged]):
+        recommendations.append({
+            'category': 'Education',
+            'scenario': scenario,
+            'issue': f"Student-teacher ratio of {ratio:.1f} exceeds national average",
+            'recommendation': "Plan for educational infrastructure expansion and teacher recruitment to maintain educational quality with population growth."
+        })
+
+    # Check housing metrics: classify every scenario's vacancy rate in one
+    # vectorized pass (first matching condition wins, -1 means healthy), then
+    # only format messages for the flagged scenarios
+    vacancy_rate = projected_data['vacancy_rate'].to_numpy()
+    housing_codes = np.select(
+        [vacancy_rate <= 0, vacancy_rate < 5, vacancy_rate > 8], [0, 1, 2], default=-1)
+    flagged = in_scope & (housing_codes >= 0)
+    for scenario, rate, code in zip(scenarios[flagged], vacancy_rate[flagged], housing_codes[flagged]):
+        issue, recommendation = HOUSING_RECOMMENDATIONS[code]
+        recommendations.append({
+            'category': 'Housing',
+            'scenario': scenario,
+            'issue': issue.format(rate=rate),
+            'recommendation': recommendation
+        })
 
     # Display recommendations
     if recommendations:
@@ -1248,39 +1436,72 @@ def display_population_projections(county_name, state_name, county_fips, populat
         'Scenario S5c'
     ]
 
-    # Create a dictionary to store all projection scenarios
-    projections_dict = {}
-
-    # Add each projection scenario to the dictionary
-    for scenario, label in zip(scenarios, scenario_labels):
-        # Get the projected 2065 population for this scenario
-        projected_pop_2065 = county_pop_projections[scenario]
-
-        # Create a copy of the historical data for this scenario
-        scenario_data = county_pop_historical.copy()
+    # Historical values are shared by every scenario, so only the 2065 point
+    # differs; drop the county_fips entry, which would otherwise be plotted
+    # as a datapoint on the x-axis
+    county_pop_historical = county_pop_historical.drop('county_fips')
+    historical = county_pop_historical.to_numpy(dtype=float)
+    projected_2065 = county_pop_projections[scenarios].to_numpy(dtype=float)
+
+    # Build every scenario column in a single allocation
+    projection_df = pd.DataFrame(
+        np.vstack([np.tile(historical[:, None], len(scenarios)), projected_2065]),
+        index=pd.to_datetime(
+            county_pop_historical.index.append(pd.Index(['2065'])), format='%Y'),
+        columns=scenario_labels,
+    )
 
-        # Add the 2065 projection to this scenario's data
-        scenario_data['2065'] = projected_pop_2065
+    # Create the chart
+    st.line_chart(projection_df)
 
-        # Add this scenario to the main dictionary
-        projections_dict[label] = scenario_data
 
-        # Convert the dictionary to a DataFrame with scenarios as the index
+def _prefetch(*queries):
+    """
+    Run independent cached database queries concurrently.
 
-    projection_df = pd.DataFrame(projections_dict)
+    The results land in st.cache_data, so the chart functions that make the
+    same calls afterwards read them from the cache instead of waiting on
+    their round trips one after another. Each query must be called with the
+    same arguments, passed the same way, as its later caller, or it will not
+    hit the same cache entry.
 
-    # Drop the county_fips column which would otherwise be included as a datapoint on the x-axis
-    projection_df = projection_df.drop(index='county_fips')
-    projection_df = projection_df.set_index(
-        pd.to_datetime(projection_df.index, format='%Y'))
+    Parameters:
+    -----------
+    *queries : callable
+        Zero-argument callables (e.g. functools.partial over a Database
+        method) to run in parallel
+    """
+    # Attach the script run context so cached calls (and any st.error they
+    # raise) behave as they would on the script thread
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(max_workers=len(queries),
+                            initializer=add_script_run_ctx,
+                            initargs=(None, ctx)) as executor:
+        futures = [executor.submit(query) for query in queries]
 
-    # Create the chart
-    st.line_chart(projection_df)
+    # Re-raise failures (including st.stop) on the script thread
+    for future in futures:
+        future.result()
 
 
 def display_housing_indicators(county_name, state_name, county_fips):
     st.header('Housing Analysis')
 
+    _prefetch(
+        partial(database.get_stat_var,
+                table=Table.COUNTY_HOUSING_DATA,
+                indicator_name="median_gross_rent",
+                county_fips=county_fips),
+        partial(database.get_stat_var,
+                table=Table.COUNTY_ECONOMIC_DATA,
+                indicator_name="median_income",
+                county_fips=county_fips),
+        partial(database.get_stat_vars,
+                table=Table.COUNTY_HOUSING_DATA,
+                indicator_names=["total_housing_units", "occupied_housing_units"],
+                county_fips=county_fips),
+    )
+
     split_row(
         lambda: display_housing_burden_plot(
             county_name, state_name, county_fips),
@@ -1290,6 +1511,40 @@ def display_housing_indicators(county_name, state_name, county_fips):
     )
 
 
+@st.cache_resource(show_spinner=False, max_entries=128)
+def _housing_burden_figure(merged_df):
+    """Build the median rent burden chart from merged rent and income data"""
+    # Reset index so 'year' becomes a column for Plotly; this returns a new
+    # frame, so the columns below never touch the caller's data
+    merged_df = merged_df.reset_index()
+
+    # Calculation using the renamed columns
+    merged_df['median_rent_burden_pct'] = (
+        (merged_df['median_gross_rent'] * 12) / merged_df['median_income']) * 100
+
+    fig = px.line(
+        merged_df,
+        x='year',  # Use the column name from the index reset
+        y='median_rent_burden_pct',
+        title=f'Median Rent Burden Over Time',
+    )
+
+    fig.update_traces(
+        line=dict(color=DIVERGING_RGB[0], width=7)
+    )
+
+    fig.update_layout(
+        xaxis_title='Year',
+        yaxis_title='Median Rent Burden (%)',
+        hovermode='x unified',
+        **RENT_BURDEN_THRESHOLDS
+    )
+
+    fig.update_yaxes(range=[0, 60])
+
+    return fig
+
+
 def display_housing_burden_plot(county_name, state_name, county_fips):
     rent_df = database.get_stat_var(
         table=Table.COUNTY_HOUSING_DATA,
@@ -1323,21 +1578,35 @@ def display_housing_burden_plot(county_name, state_name, county_fips):
             f"Matching rent and income data by year not available for {county_name}, {state_name}.")
         return
 
-    # Calculation using the renamed columns
-    merged_df['median_rent_burden_pct'] = (
-        (merged_df['median_gross_rent'] * 12) / merged_df['median_income']) * 100
+    st.plotly_chart(
+        _housing_burden_figure(merged_df),
+        use_container_width=True
+    )
 
-    # Reset index so 'year' becomes a column for Plotly
-    merged_df.reset_index(inplace=True)
 
-    # Convert the 'year' column to datetime
-    merged_df['year'] = pd.to_datetime(merged_df['year'], format='%Y')
+@st.cache_resource(show_spinner=False, max_entries=128)
+def _housing_vacancy_figure(merged_df):
+    """Build the vacancy rate chart from merged total and occupied housing units"""
+    # Reset index so 'year' becomes a column (and the caller's frame is left alone)
+    merged_df = merged_df.reset_index()
+
+    # Calculate Vacancy Rate Percentage on the raw arrays, treating years with
+    # no housing units as 0% rather than inf/NaN. Staying in float64 avoids the
+    # object-dtype detour of replacing inf with pd.NA and filling it back in
+    total_units = merged_df["total_housing_units"].to_numpy(dtype=float)
+    vacant_units = total_units - \
+        merged_df["occupied_housing_units"].to_numpy(dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        vacancy_rate_pct = vacant_units / total_units * 100
+    merged_df['vacant_units'] = vacant_units
+    merged_df['vacancy_rate_pct'] = np.where(
+        np.isfinite(vacancy_rate_pct), vacancy_rate_pct, 0)
 
     fig = px.line(
         merged_df,
-        x='year',  # Use the column name from the index reset
-        y='median_rent_burden_pct',
-        title=f'Median Rent Burden Over Time',
+        x='year',
+        y='vacancy_rate_pct',
+        title=f'Housing Vacancy Rate Over Time',
     )
 
     fig.update_traces(
@@ -1345,147 +1614,51 @@ def display_housing_burden_plot(county_name, state_name, county_fips):
     )
 
     fig.update_layout(
-        xaxis_title='Year',
-        yaxis_title='Median Rent Burden (%)',
-        hovermode='x unified'
-    )
-
-    fig.add_shape(
-        type="line",
-        x0=merged_df['year'].min(),
-        x1=merged_df['year'].max(),
-        y0=30,
-        y1=30,
-        line=dict(color=DIVERGING_RGB[3], dash="dash", width=4),
-        name="30% Threshold"
-    )
-
-    fig.add_shape(
-        type="line",
-        x0=merged_df['year'].min(),
-        x1=merged_df['year'].max(),
-        y0=50,
-        y1=50,
-        line=dict(color=DIVERGING_RGB[4], dash="dash", width=4),
-        name="50% Threshold"
-    )
-
-    fig.add_annotation(
-        x=merged_df['year'].iloc[-1],  # Use the column name
-        y=30,
-        text="30% Burden",
-        showarrow=False,
-        yshift=10,
-        xshift=20,
-        font=dict(color=DIVERGING_RGB[3])
-    )
-
-    fig.add_annotation(
-        x=merged_df['year'].iloc[-1],  # Use the column name
-        y=50,
-        text="50% Burden",
-        showarrow=False,
-        yshift=10,
-        xshift=20,
-        font=dict(color=DIVERGING_RGB[4])
+        xaxis_title='year',
+        yaxis_title='Vacancy Rate (%)',
+        hovermode='x unified',
+        **VACANCY_THRESHOLDS
     )
 
-    fig.update_yaxes(range=[0, 60])
+    fig.update_yaxes(range=[0, 20])
 
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 
 def display_housing_vacancy_plot(county_name, state_name, county_fips):
-    # Use indicator_name and expect column named "total_housing_units"
-    total_units_df = database.get_stat_var(
-        table=Table.COUNTY_HOUSING_DATA,
-        indicator_name="total_housing_units",
-        county_fips=county_fips
-    )
-
-    # Use indicator_name and expect column named "occupied_housing_units"
-    occupied_units_df = database.get_stat_var(
+    # Fetch total and occupied units in one query, indexed by year
+    merged_df = database.get_stat_vars(
         table=Table.COUNTY_HOUSING_DATA,
-        indicator_name="occupied_housing_units",
+        indicator_names=["total_housing_units", "occupied_housing_units"],
         county_fips=county_fips
     )
 
-    if total_units_df.empty or occupied_units_df.empty:
-        st.warning(
-            f"Housing unit data not available for {county_name}, {state_name}.")
-        return
-
-    # No renaming needed if columns are already named correctly
-    # total_units_df = total_units_df.rename(columns={'Value': 'Total_Units'})
-    # occupied_units_df = occupied_units_df.rename(columns={'Value': 'Occupied_Units'})
-
-    # Merge on index (assumed 'year')
-    merged_df = pd.merge(total_units_df, occupied_units_df,
-                         left_index=True, right_index=True, how='inner')
-
     if merged_df.empty:
         st.warning(
-            f"Matching total and occupied housing unit data by year not available for {county_name}, {state_name}.")
+            f"Housing unit data not available for {county_name}, {state_name}.")
         return
 
-    # Calculate Vacant Units using the direct column names
-    merged_df['vacant_units'] = merged_df["total_housing_units"] - \
-        merged_df["occupied_housing_units"]
-
-    # Calculate Vacancy Rate Percentage using the direct column name for total
-    merged_df['vacancy_rate_pct'] = (
-        merged_df['vacant_units'] / merged_df["total_housing_units"]) * 100
-    merged_df['vacancy_rate_pct'] = merged_df['vacancy_rate_pct'].replace(
-        [float('inf'), float('-inf')], pd.NA).fillna(0)
-
-    merged_df.reset_index(inplace=True)
-    merged_df['year'] = pd.to_datetime(merged_df['year'], format='%Y')
-
-    fig = px.line(
-        merged_df,
-        x='year',
-        y='vacancy_rate_pct',
-        title=f'Housing Vacancy Rate Over Time',
-    )
-    
-    fig.update_traces(
-        line=dict(color=DIVERGING_RGB[0], width=7)
+    st.plotly_chart(
+        _housing_vacancy_figure(merged_df),
+        use_container_width=True
     )
 
-    fig.update_layout(
-        xaxis_title='year',
-        yaxis_title='Vacancy Rate (%)',
-        hovermode='x unified'
-    )
-
-    healthy_vacancy_threshold = 7
-    threshold_color = DIVERGING_RGB[3]
-    fig.add_shape(
-        type="line",
-        x0=merged_df['year'].min(),
-        x1=merged_df['year'].max(),
-        y0=healthy_vacancy_threshold,
-        y1=healthy_vacancy_threshold,
-        line=dict(color=threshold_color, dash="dash", width=4),
-        name=f"{healthy_vacancy_threshold}% Threshold"
-    )
-    fig.add_annotation(
-        x=merged_df['year'].iloc[-1],
-        y=healthy_vacancy_threshold,
-        text=f"{healthy_vacancy_threshold}% Threshold",
-        showarrow=False,
-        yshift=10,
-        xshift=20,
-        font=dict(color=threshold_color)
-    )
-
-    fig.update_yaxes(range=[0, 20])
-
-    st.plotly_chart(fig, use_container_width=True)
-
 
 def display_economic_indicators(county_name, state_name, county_fips):
     st.header('Economic Analysis')
+
+    _prefetch(
+        partial(database.get_stat_var,
+                table=Table.COUNTY_ECONOMIC_DATA,
+                indicator_name="unemployment_rate",
+                county_fips=county_fips),
+        partial(database.get_stat_vars,
+                table=Table.COUNTY_ECONOMIC_DATA,
+                indicator_names=["total_labor_force", "population",
+                                 "total_employed_population"],
+                county_fips=county_fips),
+    )
+
     split_row(
         lambda: display_unemployment_rate(
             county_name, state_name, county_fips),
@@ -1495,21 +1668,10 @@ def display_economic_indicators(county_name, state_name, county_fips):
     )
 
 
-def display_unemployment_rate(county_name, state_name, county_fips):
-    unemployment_df = database.get_stat_var(
-        table=Table.COUNTY_ECONOMIC_DATA,
-        indicator_name="unemployment_rate",
-        county_fips=county_fips
-    )
-
-    if unemployment_df.empty:
-        st.warning(
-            f"Matching total and occupied housing unit data by year not available for {county_name}, {state_name}.")
-        return
-
-    unemployment_df.reset_index(inplace=True)
-    unemployment_df['year'] = pd.to_datetime(
-        unemployment_df['year'], format='%Y')
+@st.cache_resource(show_spinner=False, max_entries=128)
+def _unemployment_rate_figure(unemployment_df):
+    """Build the unemployment rate chart"""
+    unemployment_df = unemployment_df.reset_index()
 
     fig = px.line(
         unemployment_df,
@@ -1517,7 +1679,7 @@ def display_unemployment_rate(county_name, state_name, county_fips):
         y='unemployment_rate',
         title=f'Unemployment Rate Over Time'
     )
-    
+
     fig.update_traces(
         line=dict(color=DIVERGING_RGB[0], width=7)
     )
@@ -1526,74 +1688,43 @@ def display_unemployment_rate(county_name, state_name, county_fips):
         xaxis_title='Year',
         yaxis_title='Unemployment Rate (%)',
         hovermode='x unified',
-        yaxis_range=[0, None]
+        yaxis_range=[0, None],
+        **NAIRU_THRESHOLDS
     )
 
-    healthy_vacancy_threshold = 4
-    threshold_color = DIVERGING_RGB[3]
-    
-    fig.add_shape(
-        type="line",
-        x0=unemployment_df['year'].min(),
-        x1=unemployment_df['year'].max(),
-        y0=healthy_vacancy_threshold,
-        y1=healthy_vacancy_threshold,
-        line=dict(color=threshold_color, dash="dash", width=2),
-        name=f"NAIRU Threshold"
-    )
-
-    fig.add_annotation(
-        x=unemployment_df['year'].iloc[-1],
-        y=healthy_vacancy_threshold,
-        text=f"NAIRU Threshold",
-        showarrow=False,
-        yshift=10,
-        xshift=20,
-        font=dict(color=threshold_color)
-    )
-    
     fig.update_yaxes(range=[0, 15])
 
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 
-def display_labor_participation(county_name, state_name, county_fips):
-    # Fetch data from database
-    labor_df = database.get_stat_var(
-        table=Table.COUNTY_ECONOMIC_DATA,
-        indicator_name="total_labor_force",
-        county_fips=county_fips
-    )
-    total_population_df = database.get_stat_var(
+def display_unemployment_rate(county_name, state_name, county_fips):
+    unemployment_df = database.get_stat_var(
         table=Table.COUNTY_ECONOMIC_DATA,
-        indicator_name="population",
+        indicator_name="unemployment_rate",
         county_fips=county_fips
     )
 
-    employed_population_df = database.get_stat_var(
-        table=Table.COUNTY_ECONOMIC_DATA,
-        indicator_name="total_employed_population",
-        county_fips=county_fips
-    )
+    if unemployment_df.empty:
+        st.warning(
+            f"Matching total and occupied housing unit data by year not available for {county_name}, {state_name}.")
+        return
 
-    # Merge datasets
-    merged_df = pd.merge(labor_df, total_population_df,
-                         left_index=True, right_index=True, how="inner")
+    st.plotly_chart(
+        _unemployment_rate_figure(unemployment_df),
+        use_container_width=True
+    )
 
-    merged_df = pd.merge(merged_df, employed_population_df,
-                         left_index=True, right_index=True, how="inner")
 
-    if merged_df.empty:
-        st.warning(f"Data not found for {county_name}, {state_name}.")
-        return
+@st.cache_resource(show_spinner=False, max_entries=128)
+def _labor_participation_figure(merged_df, county_name, state_name):
+    """Build the labor force participation chart"""
+    # Reset index to make year a column
+    merged_df = merged_df.reset_index()
 
     # Calculate labor force participation rate
     merged_df['labor_force_participation_rate'] = (
         merged_df['total_labor_force'] / merged_df['population']) * 100
 
-    # Reset index to make year a column
-    merged_df = merged_df.reset_index()
-
     # Create figure
     fig = go.Figure()
 
@@ -1652,122 +1783,62 @@ def display_labor_participation(county_name, state_name, county_fips):
         margin=dict(l=60, r=60, t=100, b=50)
     )
 
-    # Display the chart in Streamlit
-    st.plotly_chart(fig, use_container_width=True)
-
-
-def display_education_indicators(county_name, state_name, county_fips):
-    st.header('Education Analysis')
-
-    # Retrieve all the educational attainment data
-    less_than_hs_df = database.get_stat_var(
-        Table.COUNTY_EDUCATION_DATA, "less_than_high_school_total", county_fips=county_fips)
-    hs_graduate_df = database.get_stat_var(
-        Table.COUNTY_EDUCATION_DATA, "high_school_graduate_total", county_fips=county_fips)
-    some_college_df = database.get_stat_var(
-        Table.COUNTY_EDUCATION_DATA, "some_college_total", county_fips=county_fips)
-    bachelors_higher_df = database.get_stat_var(
-        Table.COUNTY_EDUCATION_DATA, "bachelors_or_higher_total", county_fips=county_fips)
-    total_pop_25_64_df = database.get_stat_var(
-        Table.COUNTY_EDUCATION_DATA, "total_population_25_64", county_fips=county_fips)
-
-    # Combine all dataframes into one
-    final_df = pd.DataFrame()
-    final_df["year"] = less_than_hs_df.index
-    final_df["less_than_high_school_total"] = less_than_hs_df.values
-    final_df["high_school_graduate_total"] = hs_graduate_df.values
-    final_df["some_college_total"] = some_college_df.values
-    final_df["bachelors_or_higher_total"] = bachelors_higher_df.values
-    final_df["total_population_25_64"] = total_pop_25_64_df.values
-
-    # Calculate percentages
-    final_df["less_than_high_school_perc"] = (
-        final_df["less_than_high_school_total"] / final_df["total_population_25_64"]) * 100
-    final_df["high_school_graduate_perc"] = (
-        final_df["high_school_graduate_total"] / final_df["total_population_25_64"]) * 100
-    final_df["some_college_perc"] = (
-        final_df["some_college_total"] / final_df["total_population_25_64"]) * 100
-    final_df["bachelors_or_higher_perc"] = (
-        final_df["bachelors_or_higher_total"] / final_df["total_population_25_64"]) * 100
-
-    # Create a title for the chart
-    st.write(f"### Educational Attainment in {county_name}, {state_name}")
+    return fig
 
-    # Create a figure for the stacked area chart
-    fig = go.Figure()
 
-    # Define colors for better visualization
-    colors = {
-        "Less than High School": DIVERGING_RGB[3],
-        "High School Graduate": DIVERGING_RGB[2],
-        "Some College": DIVERGING_RGB[1],
-        "Bachelor's or Higher": DIVERGING_RGB[0]
-    }
+def display_labor_participation(county_name, state_name, county_fips):
+    # Fetch all three indicators in one query, indexed by year
+    merged_df = database.get_stat_vars(
+        table=Table.COUNTY_ECONOMIC_DATA,
+        indicator_names=["total_labor_force", "population",
+                         "total_employed_population"],
+        county_fips=county_fips
+    )
 
-    # Add traces in reverse order (highest education first) for better stacking visualization
-    # Each educational level is stacked on top of the previous one
+    if merged_df.empty:
+        st.warning(f"Data not found for {county_name}, {state_name}.")
+        return
 
-    # Bachelor's or Higher (Bottom layer)
-    fig.add_trace(
-        go.Scatter(
-            x=final_df["year"],
-            y=final_df["bachelors_or_higher_perc"],
-            mode="lines",
-            line=dict(width=0.5, color=colors["Bachelor's or Higher"]),
-            fill="tozeroy",
-            fillcolor=colors["Bachelor's or Higher"],
-            name="Bachelor's Degree or Higher",
-            hovertemplate="%{y:.1f}%<extra></extra>"
-        )
+    st.plotly_chart(
+        _labor_participation_figure(merged_df, county_name, state_name),
+        use_container_width=True
     )
 
-    # Some College (Second layer)
-    # We add the percentages to create proper stacking
-    fig.add_trace(
-        go.Scatter(
-            x=final_df["year"],
-            y=final_df["bachelors_or_higher_perc"] +
-            final_df["some_college_perc"],
-            mode="lines",
-            line=dict(width=0.5, color=colors["Some College"]),
-            fill="tonexty",
-            fillcolor=colors["Some College"],
-            name="Some College or Associate's Degree",
-            hovertemplate="%{y:.1f}%<extra></extra>"
-        )
-    )
 
-    # High School Graduate (Third layer)
-    fig.add_trace(
-        go.Scatter(
-            x=final_df["year"],
-            y=final_df["bachelors_or_higher_perc"] + final_df["some_college_perc"] +
-            final_df["high_school_graduate_perc"],
-            mode="lines",
-            line=dict(width=0.5, color=colors["High School Graduate"]),
-            fill="tonexty",
-            fillcolor=colors["High School Graduate"],
-            name="High School Graduate",
-            hovertemplate="%{y:.1f}%<extra></extra>"
-        )
+@st.cache_resource(show_spinner=False, max_entries=128)
+def _educational_attainment_figure(final_df):
+    """Build the stacked educational attainment chart"""
+    # Legend label and color for each attainment level, in stacking order
+    # (highest education first, at the bottom of the stack)
+    levels = {
+        "bachelors_or_higher_perc": ("Bachelor's Degree or Higher", DIVERGING_RGB[0]),
+        "some_college_perc": ("Some College or Associate's Degree", DIVERGING_RGB[1]),
+        "high_school_graduate_perc": ("High School Graduate", DIVERGING_RGB[2]),
+        "less_than_high_school_perc": ("Less than High School", DIVERGING_RGB[3]),
+    }
+    labels = {column: label for column, (label, _) in levels.items()}
+
+    # Reshape to one row per (year, level) and let plotly do the stacking
+    long_df = final_df.melt(id_vars="year", value_vars=list(levels),
+                            var_name="level", value_name="perc")
+    long_df["level"] = long_df["level"].map(labels)
+
+    # Create the stacked area chart
+    fig = px.area(
+        long_df,
+        x="year",
+        y="perc",
+        color="level",
+        color_discrete_map={label: color for label, color in levels.values()},
+        category_orders={"level": list(labels.values())},
     )
 
-    # Less than High School (Top layer)
-    # This should add up to 100%
-    fig.add_trace(
-        go.Scatter(
-            x=final_df["year"],
-            y=final_df["bachelors_or_higher_perc"] + final_df["some_college_perc"] +
-            final_df["high_school_graduate_perc"] +
-            final_df["less_than_high_school_perc"],
-            mode="lines",
-            line=dict(width=0.5, color=colors["Less than High School"]),
-            fill="tonexty",
-            fillcolor=colors["Less than High School"],
-            name="Less than High School",
-            hovertemplate="%{y:.1f}%<extra></extra>"
-        )
-    )
+    # Solid fills to match the palette, with each level's own share on hover
+    fig.for_each_trace(lambda trace: trace.update(
+        fillcolor=trace.line.color,
+        line_width=0.5,
+        hovertemplate="%{y:.1f}%<extra></extra>",
+    ))
 
     # Update layout
     fig.update_layout(
@@ -1786,6 +1857,7 @@ def display_education_indicators(county_name, state_name, county_fips):
             ticksuffix="%"
         ),
         legend=dict(
+            title=dict(text=""),
             orientation="h",
             yanchor="bottom",
             y=-0.25,
@@ -1796,243 +1868,219 @@ def display_education_indicators(county_name, state_name, county_fips):
         autosize=False,
         hovermode="x unified"
     )
-    
-    
 
-    # Display the chart
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
+
+
+# (label, column) of each attainment level shown for the latest year
+EDUCATION_ATTAINMENT_METRICS = (
+    ("Less than High School", "less_than_high_school_perc"),
+    ("High School Graduate", "high_school_graduate_perc"),
+    ("Some College or Associate's", "some_college_perc"),
+    ("Bachelor's or Higher", "bachelors_or_higher_perc"),
+)
+
+
+def display_education_indicators(county_name, state_name, county_fips):
+    st.header('Education Analysis')
+
+    # Retrieve all the educational attainment data in one query
+    final_df = database.get_stat_vars(
+        Table.COUNTY_EDUCATION_DATA,
+        ["less_than_high_school_total", "high_school_graduate_total",
+         "some_college_total", "bachelors_or_higher_total",
+         "total_population_25_64"],
+        county_fips=county_fips
+    ).reset_index()
+
+    # Calculate the percentage for every attainment level in one block division
+    levels = ["less_than_high_school", "high_school_graduate",
+              "some_college", "bachelors_or_higher"]
+    level_totals = final_df[[f"{level}_total" for level in levels]].to_numpy(dtype=float)
+    population = final_df[["total_population_25_64"]].to_numpy(dtype=float)
+    final_df[[f"{level}_perc" for level in levels]] = level_totals / population * 100
+
+    # Create a title for the chart
+    st.write(f"### Educational Attainment in {county_name}, {state_name}")
+
+    st.plotly_chart(
+        _educational_attainment_figure(final_df),
+        use_container_width=True
+    )
 
     # Optional: Add a note about the data
     st.caption(
         "Note: Data represents educational attainment for the population aged 25-64.")
 
-    # Display the latest year's data in a table format
-    latest_year = final_df["year"].max()
-    latest_data = final_df[final_df["year"] == latest_year].iloc[0]
+    # Display the latest year's data in a table format; get_stat_vars returns
+    # the years in ascending order, so the latest is the last row
+    latest_data = final_df.iloc[-1]
+    latest_year = latest_data["year"]
 
-    st.write(f"### Latest Educational Attainment ({latest_year})")
+    st.write(f"### Latest Educational Attainment ({latest_year.year})")
 
+    # Two metrics per column, in EDUCATION_ATTAINMENT_METRICS order
     col1, col2 = st.columns(2)
 
-    with col1:
-        st.metric(
-            "Less than High School",
-            f"{latest_data['less_than_high_school_perc']:.1f}%"
-        )
-        st.metric(
-            "High School Graduate",
-            f"{latest_data['high_school_graduate_perc']:.1f}%"
-        )
+    for col, (label, column) in zip((col1, col1, col2, col2), EDUCATION_ATTAINMENT_METRICS):
+        col.metric(label, f"{latest_data[column]:.1f}%")
+
+
+# Shared layout of the county unemployment line charts
+TIMESERIES_CHART_LAYOUT = dict(
+    xaxis=dict(title_text="year", showgrid=True, gridwidth=1,
+               gridcolor='rgba(0,0,0,0.1)'),
+    yaxis=dict(showgrid=True, gridwidth=1, gridcolor='rgba(0,0,0,0.1)'),
+    legend=dict(
+        orientation="h",
+        yanchor="bottom",
+        y=-0.3,
+        xanchor="center",
+        x=0.5
+    ),
+    margin=dict(l=40, r=40, t=40, b=100),
+    autosize=True,
+)
+
+# Trace configuration for each chart:
+# (column, trace name, marker symbol, color, line dash, on the right y-axis)
+UNEMPLOYMENT_TRACES = (
+    ("total_labor_force", "Total Labor Force", "circle", "blue", None, False),
+    ("unemployed_persons", "Total Unemployed", "square", "red", None, False),
+    ("unemployment_rate", "Unemployment Rate (%)",
+     "triangle-up", "green", "dash", True),
+)
+
+EDUCATION_UNEMPLOYMENT_TRACES = (
+    ("less_than_high_school_unemployment_rate",
+     "Less Than High School", "circle", None, None, False),
+    ("high_school_graduate_unemployment_rate",
+     "High School Graduate", "square", None, None, False),
+    ("some_college_unemployment_rate",
+     "Some College or Associate's Degree", "triangle-up", None, None, False),
+    ("bachelors_or_higher_unemployment_rate",
+     "Bachelor's Degree or Higher", "diamond", None, None, False),
+)
+
+
+@st.cache_resource(show_spinner=False, max_entries=128)
+def _timeseries_figure(df, traces, yaxis_title, yaxis2=None):
+    """
+    Build a line chart of several columns of a year-indexed frame.
 
-    with col2:
-        st.metric(
-            "Some College or Associate's",
-            f"{latest_data['some_college_perc']:.1f}%"
-        )
-        st.metric(
-            "Bachelor's or Higher",
-            f"{latest_data['bachelors_or_higher_perc']:.1f}%"
+    Parameters:
+    -----------
+    df : pandas.DataFrame
+        Frame indexed by year with one column per trace
+    traces : tuple
+        (column, name, marker symbol, color, dash, secondary) per trace
+    yaxis_title : str
+        Title of the left y-axis
+    yaxis2 : dict, optional
+        Layout of the right y-axis, for traces flagged as secondary
+
+    Returns:
+    --------
+    plotly.graph_objects.Figure
+    """
+    data = [
+        dict(
+            type='scattergl',
+            x=df.index,
+            y=df[column],
+            mode="lines+markers",
+            name=name,
+            line=dict(color=color, dash=dash),
+            marker=dict(symbol=symbol, color=color),
+            yaxis='y2' if secondary else 'y'
         )
+        for column, name, symbol, color, dash, secondary in traces
+    ]
+
+    layout = dict(
+        TIMESERIES_CHART_LAYOUT,
+        yaxis=dict(TIMESERIES_CHART_LAYOUT['yaxis'], title_text=yaxis_title)
+    )
+    if yaxis2 is not None:
+        layout['yaxis2'] = dict(yaxis2, overlaying='y', side='right')
+
+    return go.Figure(data=data, layout=layout)
 
 
 def display_unemployment_indicators(county_name, state_name, county_fips):
     st.header('Unemployment Analysis')
 
-    # Retrieve the unemployment data needed for the chart
-    # Using the same pattern as your education function but with economic data table
-    total_labor_force_df = database.get_stat_var(
-        Table.COUNTY_ECONOMIC_DATA, "total_labor_force", county_fips=county_fips)
-    unemployed_persons_df = database.get_stat_var(
-        Table.COUNTY_ECONOMIC_DATA, "unemployed_persons", county_fips=county_fips)
-    unemployment_rate_df = database.get_stat_var(
-        Table.COUNTY_ECONOMIC_DATA, "unemployment_rate", county_fips=county_fips)
-
-    # Combine all dataframes into one
-    total_unemployment = pd.DataFrame()
-    total_unemployment["year"] = total_labor_force_df.index
-    total_unemployment["total_labor_force"] = total_labor_force_df.values
-    total_unemployment["total_unemployed"] = unemployed_persons_df.values
-    total_unemployment["unemployment_rate"] = unemployment_rate_df.values
+    # Retrieve the unemployment data needed for the chart in one query
+    economic_df = database.get_stat_vars(
+        Table.COUNTY_ECONOMIC_DATA,
+        [column for column, *_ in UNEMPLOYMENT_TRACES],
+        county_fips=county_fips)
 
     # Create a title for the chart
     st.write(
         f"###### Total Labor Force, Unemployed Population, and Unemployment Rate (2011-2023)")
 
-    # Create a figure with secondary y-axis using Plotly
-    fig = make_subplots(specs=[[{"secondary_y": True}]])
-
-    # Add trace for Total Labor Force (left y-axis)
-    fig.add_trace(
-        go.Scatter(x=total_unemployment["year"], y=total_unemployment["total_labor_force"],
-                   mode="lines+markers", name="Total Labor Force",
-                   line=dict(color="blue"),
-                   marker=dict(symbol="circle", color="blue")),
-        secondary_y=False
-    )
-
-    # Add trace for Total Unemployed (left y-axis)
-    fig.add_trace(
-        go.Scatter(x=total_unemployment["year"], y=total_unemployment["total_unemployed"],
-                   mode="lines+markers", name="Total Unemployed",
-                   line=dict(color="red"),
-                   marker=dict(symbol="square", color="red")),
-        secondary_y=False
-    )
-
-    # Add trace for Unemployment Rate (right y-axis)
-    fig.add_trace(
-        go.Scatter(x=total_unemployment["year"], y=total_unemployment["unemployment_rate"],
-                   mode="lines+markers", name="Unemployment Rate (%)",
-                   line=dict(dash="dash", color="green"),
-                   marker=dict(symbol="triangle-up", color="green")),
-        secondary_y=True
-    )
-
-    # Set axis titles
-    fig.update_xaxes(title_text="year")
-    fig.update_yaxes(title_text="Number of People", secondary_y=False)
-    fig.update_yaxes(title_text="Unemployment Rate (%)",
-                     secondary_y=True, color="green")
-
-    # Update layout to match the matplotlib style
-    fig.update_layout(
-        xaxis=dict(showgrid=True, gridwidth=1, gridcolor='rgba(0,0,0,0.1)'),
-        yaxis=dict(showgrid=True, gridwidth=1, gridcolor='rgba(0,0,0,0.1)'),
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=-0.3,
-            xanchor="center",
-            x=0.5
+    # Display the chart
+    st.plotly_chart(
+        _timeseries_figure(
+            economic_df,
+            UNEMPLOYMENT_TRACES,
+            "Number of People",
+            yaxis2=dict(title_text="Unemployment Rate (%)", color="green")
         ),
-        margin=dict(l=40, r=40, t=40, b=100),
-        autosize=True,
+        use_container_width=True
     )
 
-    # Display the chart
-    st.plotly_chart(fig, use_container_width=True)
-
 
 def display_unemployment_by_education(county_name, state_name, county_fips):
     st.header('Unemployment by Education Level')
 
-    # Retrieve raw counts for each education level - both unemployed and total population
-    # Unemployed counts
-    less_than_hs_unemployed_df = database.get_stat_var(
-        Table.COUNTY_EDUCATION_DATA, "less_than_high_school_unemployed", county_fips=county_fips)
-    hs_graduate_unemployed_df = database.get_stat_var(
-        Table.COUNTY_EDUCATION_DATA, "high_school_graduate_unemployed", county_fips=county_fips)
-    some_college_unemployed_df = database.get_stat_var(
-        Table.COUNTY_EDUCATION_DATA, "some_college_unemployed", county_fips=county_fips)
-    bachelors_higher_unemployed_df = database.get_stat_var(
-        Table.COUNTY_EDUCATION_DATA, "bachelors_or_higher_unemployed", county_fips=county_fips)
-
-    # Total population counts
-    less_than_hs_total_df = database.get_stat_var(
-        Table.COUNTY_EDUCATION_DATA, "less_than_high_school_total", county_fips=county_fips)
-    hs_graduate_total_df = database.get_stat_var(
-        Table.COUNTY_EDUCATION_DATA, "high_school_graduate_total", county_fips=county_fips)
-    some_college_total_df = database.get_stat_var(
-        Table.COUNTY_EDUCATION_DATA, "some_college_total", county_fips=county_fips)
-    bachelors_higher_total_df = database.get_stat_var(
-        Table.COUNTY_EDUCATION_DATA, "bachelors_or_higher_total", county_fips=county_fips)
-
-    # Combine all dataframes into one
-    unemployment_by_edulevel = pd.DataFrame()
-    unemployment_by_edulevel["year"] = less_than_hs_unemployed_df.index
-
-    # Store raw counts
-    unemployment_by_edulevel["less_than_high_school_unemployed"] = less_than_hs_unemployed_df.values
-    unemployment_by_edulevel["high_school_graduate_unemployed"] = hs_graduate_unemployed_df.values
-    unemployment_by_edulevel["some_college_unemployed"] = some_college_unemployed_df.values
-    unemployment_by_edulevel["bachelors_or_higher_unemployed"] = bachelors_higher_unemployed_df.values
-
-    unemployment_by_edulevel["less_than_high_school_total"] = less_than_hs_total_df.values
-    unemployment_by_edulevel["high_school_graduate_total"] = hs_graduate_total_df.values
-    unemployment_by_edulevel["some_college_total"] = some_college_total_df.values
-    unemployment_by_edulevel["bachelors_or_higher_total"] = bachelors_higher_total_df.values
-
-    # Calculate unemployment rates by dividing unemployed by total population
-    unemployment_by_edulevel["less_than_high_school_unemployment_rate"] = (
-        unemployment_by_edulevel["less_than_high_school_unemployed"] /
-        unemployment_by_edulevel["less_than_high_school_total"] * 100
-    )
-
-    unemployment_by_edulevel["high_school_graduate_unemployment_rate"] = (
-        unemployment_by_edulevel["high_school_graduate_unemployed"] /
-        unemployment_by_edulevel["high_school_graduate_total"] * 100
-    )
-
-    unemployment_by_edulevel["some_college_unemployment_rate"] = (
-        unemployment_by_edulevel["some_college_unemployed"] /
-        unemployment_by_edulevel["some_college_total"] * 100
-    )
-
-    unemployment_by_edulevel["bachelors_or_higher_unemployment_rate"] = (
-        unemployment_by_edulevel["bachelors_or_higher_unemployed"] /
-        unemployment_by_edulevel["bachelors_or_higher_total"] * 100
+    education_levels = ["less_than_high_school", "high_school_graduate",
+                        "some_college", "bachelors_or_higher"]
+
+    # Retrieve raw counts for each education level - both unemployed and
+    # total population - in one query
+    education_df = database.get_stat_vars(
+        Table.COUNTY_EDUCATION_DATA,
+        [f"{level}_unemployed" for level in education_levels] +
+        [f"{level}_total" for level in education_levels],
+        county_fips=county_fips)
+
+    # Calculate unemployment rates for every level with one (years, 4) block
+    # division, leaving NaN where a level has no population
+    unemployed = education_df[[f"{level}_unemployed" for level in education_levels]].to_numpy(dtype=np.float64)
+    total = education_df[[f"{level}_total" for level in education_levels]].to_numpy(dtype=np.float64)
+    rates = np.divide(unemployed, total, out=np.full_like(unemployed, np.nan),
+                      where=total != 0) * 100.0
+
+    unemployment_by_edulevel = pd.DataFrame(
+        rates,
+        columns=[f"{level}_unemployment_rate" for level in education_levels],
+        index=education_df.index
     )
 
     # Create a title for the chart
     st.write(
         f"###### Unemployment Rate by Education Level (2011-2023)")
 
-    # Create a figure using Plotly
-    fig = go.Figure()
-
-    # Add traces for each education level's unemployment rate
-    fig.add_trace(
-        go.Scatter(x=unemployment_by_edulevel["year"],
-                   y=unemployment_by_edulevel["less_than_high_school_unemployment_rate"],
-                   mode="lines+markers",
-                   name="Less Than High School",
-                   marker=dict(symbol="circle"))
-    )
-
-    fig.add_trace(
-        go.Scatter(x=unemployment_by_edulevel["year"],
-                   y=unemployment_by_edulevel["high_school_graduate_unemployment_rate"],
-                   mode="lines+markers",
-                   name="High School Graduate",
-                   marker=dict(symbol="square"))
-    )
-
-    fig.add_trace(
-        go.Scatter(x=unemployment_by_edulevel["year"],
-                   y=unemployment_by_edulevel["some_college_unemployment_rate"],
-                   mode="lines+markers",
-                   name="Some College or Associate's Degree",
-                   marker=dict(symbol="triangle-up"))
-    )
-
-    fig.add_trace(
-        go.Scatter(x=unemployment_by_edulevel["year"],
-                   y=unemployment_by_edulevel["bachelors_or_higher_unemployment_rate"],
-                   mode="lines+markers",
-                   name="Bachelor's Degree or Higher",
-                   marker=dict(symbol="diamond"))
-    )
-
-    # Set axis titles and layout
-    fig.update_xaxes(title_text="year")
-    fig.update_yaxes(title_text="Unemployment Rate (%)")
-
-    fig.update_layout(
-        xaxis=dict(showgrid=True, gridwidth=1, gridcolor='rgba(0,0,0,0.1)'),
-        yaxis=dict(showgrid=True, gridwidth=1, gridcolor='rgba(0,0,0,0.1)'),
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=-0.3,
-            xanchor="center",
-            x=0.5
+    # Display the chart
+    st.plotly_chart(
+        _timeseries_figure(
+            unemployment_by_edulevel,
+            EDUCATION_UNEMPLOYMENT_TRACES,
+            "Unemployment Rate (%)"
         ),
-        margin=dict(l=40, r=40, t=40, b=100),
-        autosize=True,
+        use_container_width=True
     )
 
-    # Display the chart
-    st.plotly_chart(fig, use_container_width=True)
+
+# (label, z-score column, whether lower values are better) of each key
+# performance indicator
+KEY_INDICATORS = (
+    ("Education", "z_student_teacher_ratio", True),
+    ("Housing", "z_available_housing_units", False),
+    ("Labor", "z_unemployment_rate", True),
+)
 
 
 def display_county_indicators(county_fips, scenario):
@@ -2047,81 +2095,24 @@ def display_county_indicators(county_fips, scenario):
 
     # indicators_df = indicators_df[indicators_df["county_fips"] == county_fips]
 
-    # Extract z-scores (assuming your database function returns these values)
-    z_student_teacher = scenario_values.get('z_student_teacher_ratio', 0)
-    z_housing = scenario_values.get('z_available_housing_units', 0)
-    z_unemployment = scenario_values.get('z_unemployment_rate', 0)
-
     st.markdown("### Key Performance Indicators")
 
-    # Function to get description based on z-score
-    def get_description(z_score, is_inverse=False):
-        if is_inverse:
-            # For inverse indicators (lower is better)
-            if z_score < -1.5:
-                return "Excellent"
-            elif z_score < -0.5:
-                return "Good"
-            elif z_score < 0.5:
-                return "Average"
-            elif z_score < 1.5:
-                return "Below Average"
-            else:
-                return "Poor"
-        else:
-            # For regular indicators (higher is better)
-            if z_score > 1.5:
-                return "Excellent"
-            elif z_score > 0.5:
-                return "Good"
-            elif z_score > -0.5:
-                return "Average"
-            elif z_score > -1.5:
-                return "Below Average"
-            else:
-                return "Poor"
-
-    # Student-Teacher Ratio (lower is better)
-    if z_student_teacher:
-        st.metric(
-            label="Education",
-            value=get_description(z_student_teacher, is_inverse=True),
-            delta=f"{z_student_teacher:.1f}σ",
-            delta_color="inverse"
-        )
-    else:
-        st.metric(
-            label="Education",
-            value="N/A"
-        )
+    for label, column, is_inverse in KEY_INDICATORS:
+        # Extract z-scores (assuming your database function returns these values)
+        z_score = scenario_values.get(column, 0)
 
-    # Housing Availability (higher is better)
-    if z_housing:
-        st.metric(
-            label="Housing",
-            value=get_description(z_housing),
-            delta=f"{z_housing:.1f}σ",
-            delta_color="normal"
-        )
-    else:
-        st.metric(
-            label="Housing",
-            value="N/A"
-        )
-
-    # Unemployment Rate (lower is better)
-    if z_unemployment:
-        st.metric(
-            label="Labor",
-            value=get_description(z_unemployment, is_inverse=True),
-            delta=f"{z_unemployment:.1f}σ",
-            delta_color="inverse"
-        )
-    else:
-        st.metric(
-            label="Labor",
-            value="N/A"
-        )
+        if z_score:
+            st.metric(
+                label=label,
+                value=_z_score_description(z_score, is_inverse=is_inverse),
+                delta=f"{z_score:.1f}σ",
+                delta_color="inverse" if is_inverse else "normal"
+            )
+        else:
+            st.metric(
+                label=label,
+                value="N/A"
+            )
 
     vertical_spacer(1)
 
@@ -3,6 +3,7 @@ import streamlit as st
 
 __all__ = [
     "vertical_spacer",
+    "section_heading",
     "split_row",
     "quote_box"
 ]
@@ -38,6 +39,24 @@ def vertical_spacer(n=1):
     
     # Use markdown to render the breaks
     st.markdown(breaks, unsafe_allow_html=True)
+
+def section_heading(title: str, n=2):
+    """
+    Adds a top-level heading padded above and below with vertical space.
+
+    Renders as a single markdown element instead of a spacer, a heading and
+    another spacer, so each rerun sends one element to the front-end.
+
+    Parameters:
+    -----------
+    title : str
+        Text of the heading
+    n : int
+        Number of line breaks to add above and below (default: 2)
+    """
+    breaks = "<br>" * max(1, int(n))
+
+    st.markdown(f"{breaks}\n\n# {title}\n\n{breaks}", unsafe_allow_html=True)
     
 def split_row(left_component, right_component, ratio: List[int]):
     col1, col2 = st.columns(ratio)
@@ -1,7 +1,8 @@
+import functools
 import os
 import streamlit as st
 import pandas as pd
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, inspect, text
 from dotenv import load_dotenv
 from enum import Enum
 from typing import Optional, List, Union
@@ -34,6 +35,79 @@ class Table(Enum):
     POPULATION_PROJECTIONS = "county_population_projections"
 
 
+# Scenarios in the combined projections table, in display order
+SCENARIOS = ["original", "s3", "s5a", "s5b", "s5c"]
+
+
+# Range of the narrowest integer type query results are downcast to
+INT32_MIN, INT32_MAX = -2**31, 2**31 - 1
+
+
+def _downcast_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Narrow the numeric indicator columns of a query result
+
+    The indicators are percentages, ratios and counts well under 10^7, so
+    float32 and int32 lose nothing, and halve the bytes that every merge,
+    cache copy and chart serialization touches. Integers never go narrower
+    than int32: callers derive values such as annual rent (x12) or unit sums
+    that would silently wrap in int8/int16. Integer columns outside the
+    int32 range are left as they are. The county_fips key is left alone so
+    merges keep matching dtypes.
+
+    Parameters:
+    -----------
+    df : pandas.DataFrame
+        Query result to downcast in place
+
+    Returns:
+    --------
+    df : pandas.DataFrame
+        The same DataFrame, for chaining
+    """
+    for column in df.columns.drop("county_fips", errors="ignore"):
+        kind = df[column].dtype.kind
+        if kind == "f":
+            df[column] = df[column].astype("float32")
+        elif kind in "iu":
+            values = df[column]
+            if values.empty or (values.min() >= INT32_MIN and values.max() <= INT32_MAX):
+                df[column] = values.astype("int32")
+
+    return df
+
+
+def _stop_on_error(message: str):
+    """
+    Report a failed query in the app and stop the script run
+
+    Applied outside st.cache_data, so the cached body is just the query and a
+    failure is never stored in the cache; the next run retries it.
+
+    Parameters:
+    -----------
+    message : str
+        Description shown before the error, e.g. "Error loading county data"
+
+    Returns:
+    --------
+    decorator : callable
+        Decorator wrapping a query method with the error boundary
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                st.error(f"{message}: {str(e)}")
+                st.stop()
+
+        return wrapper
+
+    return decorator
+
+
 class Database:
     _instance = None
 
@@ -108,7 +182,8 @@ class Database:
             self.conn.close()
             self.conn = None
 
-    @st.cache_data
+    @_stop_on_error("Error loading population projections")
+    @st.cache_data(show_spinner=False)
     def get_population_projections_by_fips(_self, county_fips: Optional[Union[str, List[str]]] = None) -> pd.DataFrame:
         """
         Get population projections for a specific county by FIPS code
@@ -124,26 +199,23 @@ class Database:
             DataFrame containing population projection data
         """
         conn = _self.conn
-        try:
-            query = "SELECT * FROM county_population_projections"
+        query = "SELECT * FROM county_population_projections"
 
-            # Add county_fips filter if provided
-            if county_fips is not None:
-                if isinstance(county_fips, list):
-                    fips_list = ", ".join(str(fips) for fips in county_fips)
-                    query += f" WHERE county_fips IN ({fips_list})"
-                else:
-                    query += f" WHERE county_fips = {county_fips}"
+        # Add county_fips filter if provided
+        if county_fips is not None:
+            if isinstance(county_fips, list):
+                fips_list = ", ".join(str(fips) for fips in county_fips)
+                query += f" WHERE county_fips IN ({fips_list})"
+            else:
+                query += f" WHERE county_fips = {county_fips}"
 
-            # Execute query and return as DataFrame
-            df = pd.read_sql(query, conn)
+        # Execute query and return as DataFrame
+        df = pd.read_sql(query, conn)
 
-            return df
-        except Exception as e:
-            st.error(f"Error loading population projections: {str(e)}")
-            st.stop()
+        return df
 
-    @st.cache_data
+    @_stop_on_error("Error loading historical population counts")
+    @st.cache_data(show_spinner=False)
     def get_population_timeseries(_self, county_fips: Optional[Union[str, List[str]]] = None) -> pd.DataFrame:
         """
         Get population history for a specific county by FIPS code
@@ -159,26 +231,23 @@ class Database:
             DataFrame containing population projection data
         """
         conn = _self.conn
-        try:
-            query = "SELECT * FROM timeseries_population"
+        query = "SELECT * FROM timeseries_population"
 
-            # Add county_fips filter if provided
-            if county_fips is not None:
-                if isinstance(county_fips, list):
-                    fips_list = ", ".join(str(fips) for fips in county_fips)
-                    query += f" WHERE county_fips IN ({fips_list})"
-                else:
-                    query += f" WHERE county_fips = {county_fips}"
+        # Add county_fips filter if provided
+        if county_fips is not None:
+            if isinstance(county_fips, list):
+                fips_list = ", ".join(str(fips) for fips in county_fips)
+                query += f" WHERE county_fips IN ({fips_list})"
+            else:
+                query += f" WHERE county_fips = {county_fips}"
 
-            # Execute query and return as DataFrame
-            df = pd.read_sql(query, conn)
+        # Execute query and return as DataFrame
+        df = pd.read_sql(query, conn)
 
-            return df
-        except Exception as e:
-            st.error(f"Error loading historical population counts: {str(e)}")
-            st.stop()
+        return df
 
-    @st.cache_data
+    @_stop_on_error("Error loading historical median gross rent")
+    @st.cache_data(show_spinner=False)
     def get_timeseries_median_gross_rent(_self, county_fips: Optional[Union[str, List[str]]] = None) -> pd.DataFrame:
         """
         Get time series data for median gross rent for the specified county by FIPS code
@@ -194,27 +263,24 @@ class Database:
             DataFrame containing population projection data
         """
         conn = _self.conn
-        try:
-            query = "SELECT * FROM timeseries_median_gross_rent"
+        query = "SELECT * FROM timeseries_median_gross_rent"
 
-            # Add county_fips filter if provided
-            if county_fips is not None:
-                if isinstance(county_fips, list):
-                    fips_list = ", ".join(str(fips) for fips in county_fips)
-                    query += f" WHERE \"county_fips\" IN ({fips_list})"
-                else:
-                    query += f" WHERE \"county_fips\" = {county_fips}"
+        # Add county_fips filter if provided
+        if county_fips is not None:
+            if isinstance(county_fips, list):
+                fips_list = ", ".join(str(fips) for fips in county_fips)
+                query += f" WHERE \"county_fips\" IN ({fips_list})"
+            else:
+                query += f" WHERE \"county_fips\" = {county_fips}"
 
-            # Execute query and return as DataFrame
-            df = pd.read_sql(query, conn).set_index("county_fips")
+        # Execute query and return as DataFrame
+        df = pd.read_sql(query, conn).set_index("county_fips")
 
-            return df.T
-        except Exception as e:
-            st.error(f"Error loading historical median gross rent: {str(e)}")
-            st.stop()
+        return df.T
 
-    @st.cache_data
-    def get_stat_var(_self, table: Table, indicator_name: str, county_fips: str, year: Optional[int] = None) -> pd.DataFrame:
+    @_stop_on_error("Error loading time series data")
+    @st.cache_data(show_spinner=False)
+    def get_stat_var(_self, table: Table, indicator_name: str, county_fips: Optional[Union[str, List[str]]], year: Optional[int] = None) -> pd.DataFrame:
         """
         Get county data from a statistical variable's specified table
 
@@ -224,7 +290,7 @@ class Database:
             Enum for the table to query in the database.
         indicator_name : str
             Name of the indicator to pull from the table.
-        county_fips : str or list
+        county_fips : str or list, optional
             County FIPS code(s) to query. If None, returns all counties.
         year : int, optional
             Specific year to query. If None, returns all years.
@@ -232,55 +298,101 @@ class Database:
         Returns:
         --------
         df : pandas.DataFrame
-            DataFrame containing population projection data
+            DataFrame containing the indicator, indexed by year as datetimes
         """
-        conn = _self.conn
+        # Check out a pooled connection rather than sharing _self.conn, so
+        # that independent queries can run concurrently from worker threads
+        conn = _self.engine
         table_name = table.value
 
-        try:
-            # Initialize parameters dictionary
-            params = {}
+        # Initialize parameters dictionary
+        params = {}
 
-            # Add county_fips filter if provided
-            if county_fips is not None:
-                if isinstance(county_fips, list):
-                    # Create base query
-                    query = f'SELECT "year", "{indicator_name}", "county_fips" FROM "{table_name}"'
+        # Add county_fips filter if provided
+        if county_fips is not None:
+            if isinstance(county_fips, list):
+                # Create base query
+                query = f'SELECT "year", "{indicator_name}", "county_fips" FROM "{table_name}"'
 
-                    # For multiple counties
-                    query += " WHERE \"county_fips\" IN :county_fips"
-                    params['county_fips'] = tuple(
-                        str(fips) for fips in county_fips)
-                else:
-                    # Create base query
-                    query = f'SELECT "year", "{indicator_name}" FROM "{table_name}"'
+                # For multiple counties
+                query += " WHERE \"county_fips\" IN :county_fips"
+                params['county_fips'] = tuple(
+                    str(fips) for fips in county_fips)
+            else:
+                # Create base query
+                query = f'SELECT "year", "{indicator_name}" FROM "{table_name}"'
 
-                    # For single county
-                    query += " WHERE \"county_fips\" = :county_fips"
-                    params['county_fips'] = str(county_fips)
+                # For single county
+                query += " WHERE \"county_fips\" = :county_fips"
+                params['county_fips'] = str(county_fips)
 
-                if year:
-                    query += f' AND "year" = :year'
-                    params['year'] = year
+            if year:
+                query += f' AND "year" = :year'
+                params['year'] = year
+        else:
+            # Create base query for all counties
+            query = f'SELECT "year", "{indicator_name}", "county_fips" FROM "{table_name}"'
 
-            # Sort the results of the query
-            query += f" ORDER BY \"{table_name}\".\"year\" ASC"
+            if year:
+                query += ' WHERE "year" = :year'
+                params['year'] = year
 
-            # Convert to SQLAlchemy text object
-            sql_query = text(query)
+        # Sort the results of the query
+        query += f" ORDER BY \"{table_name}\".\"year\" ASC"
 
-            # Execute query and return as DataFrame
-            df = pd.read_sql(sql_query, conn, params=params)
+        # Convert to SQLAlchemy text object
+        sql_query = text(query)
 
-            df.year = pd.to_datetime(df.year, format='%Y').dt.year
-            df = df.set_index("year")
+        # Execute query and return as DataFrame
+        df = pd.read_sql(sql_query, conn, params=params)
 
-            return df
-        except Exception as e:
-            st.error(f"Error loading time series data: {str(e)}")
-            st.stop()
+        # Parse years once here so the cached frame is chart-ready
+        df.year = pd.to_datetime(df.year, format='%Y')
+        df = _downcast_numeric(df.set_index("year"))
+
+        return df
+
+    @_stop_on_error("Error loading time series data")
+    @st.cache_data(show_spinner=False)
+    def get_stat_vars(_self, table: Table, indicator_names: List[str], county_fips: str) -> pd.DataFrame:
+        """
+        Get several indicators for one county from a table in a single query
+
+        Parameters:
+        -----------
+        table : SQL table to be queried
+            Enum for the table to query in the database.
+        indicator_names : list of str
+            Names of the indicator columns to pull from the table.
+        county_fips : str
+            County FIPS code to query.
+
+        Returns:
+        --------
+        df : pandas.DataFrame
+            DataFrame indexed by year (as datetimes) with one column per
+            indicator
+        """
+        # Check out a pooled connection rather than sharing _self.conn, so
+        # that independent queries can run concurrently from worker threads
+        conn = _self.engine
+        table_name = table.value
+
+        columns = ", ".join(f'"{name}"' for name in indicator_names)
+        query = text(f'SELECT "year", {columns} FROM "{table_name}" '
+                     'WHERE "county_fips" = :county_fips '
+                     'ORDER BY "year" ASC')
+
+        df = pd.read_sql(query, conn, params={'county_fips': str(county_fips)})
 
-    @st.cache_data
+        # Parse years once here so the cached frame is chart-ready
+        df.year = pd.to_datetime(df.year, format='%Y')
+        df = _downcast_numeric(df.set_index("year"))
+
+        return df
+
+    @_stop_on_error("Error loading county data counts")
+    @st.cache_data(show_spinner=False)
     def get_county_metadata(_self, county_fips: Optional[Union[str, List[str]]] = None) -> pd.DataFrame:
         """
         Get county time series data from the specified table
@@ -296,39 +408,36 @@ class Database:
             DataFrame containing county metadata
         """
         conn = _self.conn
-        try:
-            # Start with the base query
-            query = f"SELECT * FROM {Table.COUNTY_METADATA.value}"
-
-            # Add county_fips filter if provided
-            if county_fips is not None:
-                if isinstance(county_fips, list):
-                    # Create proper parameter placeholders for IN clause
-                    placeholders = ", ".join(
-                        f":fips_{i}" for i in range(len(county_fips)))
-                    query += f" WHERE \"county_fips\" IN ({placeholders})"
-
-                    # Create a dictionary of parameters
-                    params = {f"fips_{i}": fips for i,
-                              fips in enumerate(county_fips)}
-                else:
-                    query += " WHERE \"county_fips\" = :county_fips"
-                    params = {'county_fips': county_fips}
+        # Start with the base query
+        query = f"SELECT * FROM {Table.COUNTY_METADATA.value}"
+
+        # Add county_fips filter if provided
+        if county_fips is not None:
+            if isinstance(county_fips, list):
+                # Create proper parameter placeholders for IN clause
+                placeholders = ", ".join(
+                    f":fips_{i}" for i in range(len(county_fips)))
+                query += f" WHERE \"county_fips\" IN ({placeholders})"
+
+                # Create a dictionary of parameters
+                params = {f"fips_{i}": fips for i,
+                          fips in enumerate(county_fips)}
             else:
-                params = {}
+                query += " WHERE \"county_fips\" = :county_fips"
+                params = {'county_fips': county_fips}
+        else:
+            params = {}
 
-            # Convert to SQLAlchemy text object
-            sql_query = text(query)
+        # Convert to SQLAlchemy text object
+        sql_query = text(query)
 
-            # Execute query and return as DataFrame
-            df = pd.read_sql(sql_query, conn, params=params)
+        # Execute query and return as DataFrame
+        df = pd.read_sql(sql_query, conn, params=params)
 
-            return df
-        except Exception as e:
-            st.error(f"Error loading county data counts: {str(e)}")
-            st.stop()
+        return df
 
-    @st.cache_data
+    @_stop_on_error("Error loading county CBSA data")
+    @st.cache_data(show_spinner=False)
     def get_cbsa_counties(_self, filter: Optional[str] = None) -> pd.DataFrame:
         """
         Get counties that belong to a metropolitan statistical area (MSA) along with their metadata
@@ -346,34 +455,31 @@ class Database:
             DataFrame containing the counties along with MSA data and county metadata
         """
         conn = _self.conn
-        try:
-            # Base query with JOIN to get metadata for matching county_fips
-            query = f'''
-                SELECT 
-                    cbsa."cbsa", 
-                    cbsa."type",
-                    meta.*
-                FROM {Table.COUNTY_CBSA_DATA.value} cbsa
-                JOIN {Table.COUNTY_METADATA.value} meta
-                ON cbsa."county_fips" = meta."county_fips"
-            '''
-
-            # Apply filter if provided
-            if filter is not None and isinstance(filter, str):
-                if filter == 'metro':
-                    query += f" WHERE cbsa.\"type\" = 'Metropolitan Statistical Area'"
-                elif filter == 'micro':
-                    query += f" WHERE cbsa.\"type\" = 'Micropolitan Statistical Area'"
-
-            # Execute query and return as DataFrame
-            df = pd.read_sql(query, conn)
-
-            return df
-        except Exception as e:
-            st.error(f"Error loading county CBSA data: {str(e)}")
-            st.stop()
-
-    @st.cache_data
+        # Base query with JOIN to get metadata for matching county_fips
+        query = f'''
+            SELECT 
+                cbsa."cbsa", 
+                cbsa."type",
+                meta.*
+            FROM {Table.COUNTY_CBSA_DATA.value} cbsa
+            JOIN {Table.COUNTY_METADATA.value} meta
+            ON cbsa."county_fips" = meta."county_fips"
+        '''
+
+        # Apply filter if provided
+        if filter is not None and isinstance(filter, str):
+            if filter == 'metro':
+                query += f" WHERE cbsa.\"type\" = 'Metropolitan Statistical Area'"
+            elif filter == 'micro':
+                query += f" WHERE cbsa.\"type\" = 'Micropolitan Statistical Area'"
+
+        # Execute query and return as DataFrame
+        df = pd.read_sql(query, conn)
+
+        return df
+
+    @_stop_on_error("Error loading socioeconomic indices")
+    @st.cache_data(show_spinner=False)
     def get_projections_by_county(_self, county_fips: str) -> pd.DataFrame:
         """
         Get socioeconomic indices for a specific county by FIPS code
@@ -389,22 +495,19 @@ class Database:
             DataFrame containing socioeconomic indices for the specified county
         """
         conn = _self.conn
-        try:
-            query = text(
-                "SELECT * FROM projected_socioeconomic_indices WHERE \"county_fips\" = :county_fips")
+        query = text(
+            "SELECT * FROM projected_socioeconomic_indices WHERE \"county_fips\" = :county_fips")
 
-            # Execute query with parameter
-            df = pd.read_sql(query, conn, params={'county_fips': county_fips})
+        # Execute query with parameter
+        df = pd.read_sql(query, conn, params={'county_fips': county_fips})
 
-            # Reset index and drop the old index
-            df = df.reset_index(drop=True)
+        # Reset index and drop the old index
+        df = _downcast_numeric(df.reset_index(drop=True))
 
-            return df
-        except Exception as e:
-            st.error(f"Error loading socioeconomic indices: {str(e)}")
-            st.stop()
+        return df
 
-    @st.cache_data
+    @_stop_on_error("Error loading socioeconomic indices")
+    @st.cache_data(show_spinner=False)
     def get_table_for_county(_self, table: Table, county_fips: str) -> pd.DataFrame:
         """
         Get socioeconomic indices for a specific county by FIPS code
@@ -420,79 +523,153 @@ class Database:
             DataFrame containing socioeconomic indices for the specified county
         """
         conn = _self.conn
-        try:
-            query = text(
-                f"SELECT * FROM {table.value} WHERE \"county_fips\" = :county_fips")
+        query = text(
+            f"SELECT * FROM {table.value} WHERE \"county_fips\" = :county_fips")
 
-            # Execute query with parameter
-            df = pd.read_sql(query, conn, params={'county_fips': county_fips})
+        # Execute query with parameter
+        df = pd.read_sql(query, conn, params={'county_fips': county_fips})
 
-            # Reset index and drop the old index
-            df = df.reset_index(drop=True)
+        # Reset index and drop the old index
+        df = df.reset_index(drop=True)
 
-            return df
-        except Exception as e:
-            st.error(f"Error loading socioeconomic indices: {str(e)}")
-            st.stop()
+        return df
 
-    @st.cache_data
-    def get_index_projections(_self, county_fips: str, scenario: str):
+    @st.cache_data(show_spinner=False)
+    def get_combined_projections(_self, county_fips: str) -> pd.DataFrame:
+        """
+        Get the combined scenario projections for a county, with the housing
+        occupancy and vacancy rates derived once for every consumer
+
+        Parameters:
+        -----------
+        county_fips : str
+            County FIPS code to query.
+
+        Returns:
+        --------
+        df : pandas.DataFrame
+            Rows of the combined projections table for the county, ordered by
+            an ordered categorical "scenario" column (see SCENARIOS), plus
+            "housing_occupancy_rate" and "vacancy_rate" columns in percent
+        """
+        df = _downcast_numeric(_self.get_table_for_county(
+            Table.COUNTY_COMBINED_PROJECTIONS, county_fips))
+
+        # Scenario is a handful of repeated labels; as an ordered categorical
+        # sorting and membership tests work on small integer codes
+        df['scenario'] = pd.Categorical(
+            df['scenario'], categories=SCENARIOS, ordered=True)
+        df = df.sort_values('scenario', ignore_index=True)
+
+        occupied_units = df['occupied_housing_units']
+        df['housing_occupancy_rate'] = (
+            occupied_units / (occupied_units + df['available_housing_units'])) * 100
+        df['vacancy_rate'] = 100 - df['housing_occupancy_rate']
+
+        return df
+
+    @_stop_on_error("Error loading socioeconomic indices")
+    @st.cache_data(show_spinner=False)
+    def get_index_projections_by_scenario(_self, scenario: str) -> pd.DataFrame:
+        """
+        Get the national z-scores of every county for one migration scenario
+
+        Parameters:
+        -----------
+        scenario : str
+            Scenario column name (e.g. "population_2065_s5a") or scenario id
+            (e.g. "s5a").
+
+        Returns:
+        --------
+        df : pandas.DataFrame
+            DataFrame indexed by county_fips with one column per z-score
+        """
         conn = _self.conn
-        try:
-            query = text(
-                'SELECT "scenario", "z_student_teacher_ratio", "z_available_housing_units", "z_unemployment_rate" '
-                f'FROM {Table.COUNTY_COMBINED_PROJECTIONS.value} '
-                'WHERE "county_fips" = :county_fips'
-            )
-            
-            # Execute query with parameter
-            df = pd.read_sql(query, conn, params={'county_fips': county_fips})
+        query = text(
+            'SELECT "county_fips", "z_student_teacher_ratio", "z_available_housing_units", "z_unemployment_rate" '
+            f'FROM {Table.COUNTY_COMBINED_PROJECTIONS.value} '
+            'WHERE "scenario" = :scenario'
+        )
 
-            # Reset index and drop the old index
-            df = df.reset_index(drop=True)
-            
-            scenario_id = scenario.split("_")[-1]
-            
-            df = df[df["scenario"] == scenario_id]
+        scenario_id = scenario.split("_")[-1]
 
-            return df.iloc[0]
-        except Exception as e:
-            st.error(f"Error loading socioeconomic indices: {str(e)}")
-            st.stop()
-            
-    @st.cache_data
+        # Execute query with parameter
+        df = pd.read_sql(query, conn, params={'scenario': scenario_id})
+
+        # Keep each county's first row, so a duplicated county still maps to
+        # a single row of z-scores
+        return df.drop_duplicates("county_fips").set_index("county_fips")
+
+    def get_index_projections(_self, county_fips: str, scenario: str) -> pd.Series:
+        """
+        Get the z-scores of one county for a migration scenario
+
+        Served from the cached national table for the scenario, so picking
+        another county does not go back to the database.
+
+        Parameters:
+        -----------
+        county_fips : str
+            County FIPS code to look up.
+        scenario : str
+            Scenario column name (e.g. "population_2065_s5a") or scenario id.
+
+        Returns:
+        --------
+        row : pandas.Series
+            The county's z-scores, or an empty Series if it has none
+        """
+        z_scores = _self.get_index_projections_by_scenario(scenario)
+
+        if county_fips not in z_scores.index:
+            return pd.Series(dtype="float64")
+
+        return z_scores.loc[county_fips]
+
+    @_stop_on_error("Error loading receiver places")
+    @st.cache_data(show_spinner=False)
     def get_receiver_places(_self):
-        try:
-            df = pd.read_sql(f"SELECT * FROM {Table.RECEIVER_PLACES.value}", _self.engine)
-            return df
-        except Exception as e:
-            st.error(f"Error loading receiver places: {str(e)}")
-            st.stop()
+        df = pd.read_sql(f"SELECT * FROM {Table.RECEIVER_PLACES.value}", _self.engine)
+        return df
             
-    @st.cache_data
+    @_stop_on_error("Error loading county geometries")
     def get_county_geometries(_self):
-        try:
-            query = text('SELECT "county_fips", "name", "geometry" FROM '
-                         f'{Table.COUNTY_METADATA.value}')
-            
-            df = pd.read_sql(query, _self.engine)
+        """
+        Get county boundaries for the choropleth maps
 
-            return df
-        except Exception as e:
-            st.error(f"Error loading county geometries: {str(e)}")
-            st.stop()
+        Not cached here: the only caller parses the result into a
+        process-wide st.cache_resource GeoDataFrame, so st.cache_data would
+        just pickle and copy the largest frame in the app a second time.
+
+        Returns:
+        --------
+        df : pandas.DataFrame
+            DataFrame with "county_fips", "name" and either a "geometry_wkb"
+            column (hex-encoded WKB) or, for databases loaded before WKB
+            storage was introduced, a "geometry" column of WKT strings
+        """
+        columns = {
+            column["name"] for column in
+            inspect(_self.engine).get_columns(Table.COUNTY_METADATA.value)
+        }
+        geometry_column = "geometry_wkb" if "geometry_wkb" in columns else "geometry"
+
+        query = text(f'SELECT "county_fips", "name", "{geometry_column}" FROM '
+                     f'{Table.COUNTY_METADATA.value}')
+        
+        df = pd.read_sql(query, _self.engine)
+
+        return df
             
+    @_stop_on_error("Error loading state geometries")
     def get_state_geometries(_self):
-        try:
-            query = text('SELECT "STATE_FIPS", "NAME", "GEOMETRY" FROM '
-                         f'{Table.STATE_METADATA.value}')
-            
-            df = pd.read_sql(query, _self.engine)
+        query = text('SELECT "STATE_FIPS", "NAME", "GEOMETRY" FROM '
+                     f'{Table.STATE_METADATA.value}')
+        
+        df = pd.read_sql(query, _self.engine)
 
-            return df
-        except Exception as e:
-            st.error(f"Error loading state geometries: {str(e)}")
-            st.stop()
+        return df
 
 # Create a singleton instance for easy import
 db = Database()
@@ -1,11 +1,7 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import src.components as cmpt
-from plotly.subplots import make_subplots
 
-from src.db import db as database, Table, get_db_connection
+from src.db import db as database, get_db_connection
 
 # Initialize the Database connection
 get_db_connection()
@@ -27,14 +23,27 @@ st.html(
 cmpt.quote_box("Climate change is already profoundly reshaping where Americans reside and where continued habitation is no longer viable. The increasing frequency of wildfires, floods, extreme heat waves, and rising sea levels has already displaced over 3.2 million people in the United States between 2000 and 2020 alone. Projections indicate that by 2070, sea level rise could disrupt the lives of an additional 13 million individuals.")
 cmpt.vertical_spacer(2)
 
-counties = database.get_cbsa_counties(filter="metro").set_index('county_fips')
+# The county list is read-only on this page, so build its lookups once per
+# process rather than on every rerun
+@st.cache_resource(show_spinner=False)
+def _load_counties():
+    counties = database.get_cbsa_counties(filter="metro").set_index('county_fips')
+    counties = counties[counties["state"] != 6]
 
-counties = counties[counties["state"] != 6]
+    # Plain dicts for the selectbox: format_func runs once per option on
+    # every rerun, so avoid a pandas .loc lookup for each county
+    county_names = dict(zip(counties.index, counties['name']))
+    county_positions = {fips: i for i, fips in enumerate(counties.index)}
 
-population_historical = database.get_population_timeseries().set_index('county_fips')
+    # Separate the county and state names for every county in one pass
+    split_names = counties['name'].str.split(', ', n=1, expand=True)
+    county_state_names = dict(
+        zip(counties.index, zip(split_names[0], split_names[1])))
 
-population_projections = database.get_population_projections_by_fips(
-).set_index('county_fips')
+    return county_names, county_positions, county_state_names
+
+
+county_names, county_positions, county_state_names = _load_counties()
 
 selected_county_fips = 36029
 
@@ -42,10 +51,10 @@ selected_county_fips = 36029
 with st.sidebar:
     selected_county_fips = st.selectbox(
         'Select a county',
-        counties.index,
-        format_func=lambda fips: counties['name'].loc[fips],
+        list(county_names),
+        format_func=county_names.__getitem__,
         placeholder='Type to search...',
-        index=counties.index.get_loc(selected_county_fips)
+        index=county_positions[selected_county_fips]
     )
 
     scenario_names = {
@@ -65,8 +74,11 @@ with st.sidebar:
 
     cmpt.vertical_spacer(2)
 
+    # Only the selected county's projections are needed, so query that row
+    # rather than loading the nationwide table
     cmpt.display_migration_impact_analysis(
-        population_projections.loc[selected_county_fips],
+        database.get_population_projections_by_fips(
+            selected_county_fips).iloc[0],
         selected_scenario
     )
 
@@ -116,11 +128,7 @@ cmpt.vertical_spacer(2)
 
 # Get the County FIPS code, which will be used for all future queries
 if selected_county_fips:
-    county_metadata = database.get_county_metadata(
-        selected_county_fips).iloc[0]
-    # Separate the county and state names
-    full_name = county_metadata['name']
-    county_name, state_name = full_name.split(', ')
+    county_name, state_name = county_state_names[selected_county_fips]
 else:
     county_name = state_name = selected_county_fips = None
 
@@ -137,16 +145,9 @@ if selected_county_fips:
     
 
     # Current County Performance Analysis
-    cmpt.vertical_spacer(2)
+    cmpt.section_heading("Current County Performance")
     
-    st.markdown("""
-        # Current County Performance
-        """)
-    
-    cmpt.vertical_spacer(2)
-    
-    projected_data = database.get_table_for_county(
-        Table.COUNTY_COMBINED_PROJECTIONS, selected_county_fips)
+    projected_data = database.get_combined_projections(selected_county_fips)
 
     # Current State of County
     cmpt.display_housing_indicators(
@@ -164,12 +165,7 @@ if selected_county_fips:
 
     # Climate Impact Analysis
     # st.header("Climate Impact Analysis")
-    cmpt.vertical_spacer(2)
-    st.markdown("""
-        # Climate Migration Impacts
-        """)
-    
-    cmpt.vertical_spacer(2)
+    cmpt.section_heading("Climate Migration Impacts")
 
     
     # Display the impact analysis
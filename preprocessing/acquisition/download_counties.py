@@ -1,7 +1,9 @@
-import re
+import time
 import censusdis.data as ced
+import geopandas as gpd
 import pandas as pd
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from censusdis.datasets import ACS5
 
@@ -9,38 +11,76 @@ from censusdis.datasets import ACS5
 DATA_DIR = Path("./data/processed/cleaned_data/")
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-# Download 2010 county data
-counties_2010 = ced.download(
-    dataset=ACS5,
-    vintage=2010,
-    download_variables=["NAME"],
-    state="*",
-    county="*",
-    with_geometry=True,
-)
-counties_2010["COUNTY_FIPS"] = counties_2010["STATE"] + counties_2010["COUNTY"]
-counties_2010.columns = counties_2010.columns.str.lower()
-counties_2010 = counties_2010.set_index("county_fips")
-
-
-
-# Download 2020 county data
-counties_2020 = ced.download(
-    dataset=ACS5,
-    vintage=2020,
-    download_variables=["NAME"],
-    state="*",
-    county="*",
-    with_geometry=True,
-)
-counties_2020["COUNTY_FIPS"] = counties_2020["STATE"] + counties_2020["COUNTY"]
-counties_2020.columns = counties_2020.columns.str.lower()
-counties_2020 = counties_2020.set_index("county_fips")
-
-# Combine the datasets
-# Prioritize 2020 data for common FIPS, keep unique 2010 FIPS
-# Concatenate 2010 first, then 2020. Drop duplicates keeping the last (2020)
-combined_counties = pd.concat([counties_2010, counties_2020])
-counties = combined_counties[~combined_counties.index.duplicated(keep='last')]
-
-counties.to_csv(DATA_DIR / "county.csv")
+# County rosters of past vintages never change, so keep a local copy of
+# each download rather than fetching and parsing the TIGER shapes every run
+CACHE_DIR = Path("./data/raw/county_geometries/")
+CACHE_DIR.mkdir(parents=True, exist_ok=True)
+CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+
+
+def load_or_download(vintage: int) -> gpd.GeoDataFrame:
+    """
+    Load the ACS5 county roster and geometries for a vintage, downloading
+    them only when there is no fresh cached copy.
+
+    Parameters:
+    -----------
+    vintage : int
+        ACS5 vintage year to load.
+
+    Returns:
+    --------
+    counties : geopandas.GeoDataFrame
+        County names and geometries, indexed by county_fips
+    """
+    cache_path = CACHE_DIR / f"counties_{vintage}.parquet"
+
+    if cache_path.exists() and time.time() - cache_path.stat().st_mtime < CACHE_TTL_SECONDS:
+        return gpd.read_parquet(cache_path)
+
+    try:
+        counties = ced.download(
+            dataset=ACS5,
+            vintage=vintage,
+            download_variables=["NAME"],
+            state="*",
+            county="*",
+            with_geometry=True,
+        )
+    except Exception as e:
+        # Fall back to a stale copy rather than failing the pipeline
+        if cache_path.exists():
+            print(f"Could not download {vintage} counties, using cached copy: {e}")
+            return gpd.read_parquet(cache_path)
+        raise
+
+    counties["COUNTY_FIPS"] = counties["STATE"] + counties["COUNTY"]
+    counties.columns = counties.columns.str.lower()
+    counties = counties.set_index("county_fips")
+
+    counties.to_parquet(cache_path)
+
+    return counties
+
+
+def main():
+    # Load the 2010 and 2020 county data concurrently, the downloads are I/O bound
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        counties_2010, counties_2020 = executor.map(load_or_download, [2010, 2020])
+
+    # Combine the datasets
+    # Prioritize 2020 data for common FIPS, keep unique 2010 FIPS
+    # Concatenate 2010 first, then 2020. Drop duplicates keeping the last (2020)
+    combined_counties = pd.concat([counties_2010, counties_2020])
+    counties = combined_counties[~combined_counties.index.duplicated(keep='last')]
+
+    # Store geometries as hex-encoded WKB, which the dashboard decodes much faster than WKT
+    counties = pd.DataFrame(counties.drop(columns="geometry")).assign(
+        geometry_wkb=counties.geometry.to_wkb(hex=True)
+    )
+
+    counties.to_csv(DATA_DIR / "county.csv")
+
+
+if __name__ == "__main__":
+    main()
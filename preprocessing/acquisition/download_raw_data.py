@@ -6,6 +6,9 @@ from dotenv import load_dotenv
 from typing import List, Tuple, Dict, Optional
 import os
 import concurrent.futures
+import csv
+import hashlib
+import json
 import time
 
 load_dotenv()
@@ -90,16 +93,79 @@ CONFIG = {
         },
     },
     "MAX_WORKERS": min(32, (os.cpu_count() or 1) + 4),  # Optimized concurrency
-    "MAX_COUNTY_WORKERS": min(50, (os.cpu_count() or 1) * 2),  # Specific for county downloads
+    "MAX_COUNTY_WORKERS": 8,  # Specific for county downloads, each request fetches a whole batch
+    "DATACOMMONS_BATCH_SIZE": 500,  # Places per Data Commons bulk request
+    "DATACOMMONS_CACHE_DIR": Path("./data/raw/.dc_cache"),  # Responses saved for re-runs
 }
 
 
+def _cached_datacommons_call(fetch, *args):
+    """Call a Data Commons API function, reusing the response saved by an earlier run"""
+    key = hashlib.sha1(repr((fetch.__name__, args)).encode()).hexdigest()
+    cache_file = CONFIG["DATACOMMONS_CACHE_DIR"] / f"{key}.json"
+
+    if cache_file.exists():
+        return json.loads(cache_file.read_text())
+
+    response = fetch(*args)
+
+    # Write to a temporary file first so an interrupted run never leaves a partial response
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    temp_file = cache_file.with_suffix(".tmp")
+    temp_file.write_text(json.dumps(response))
+    temp_file.replace(cache_file)
+
+    return response
+
+
+class _YearFileWriter:
+    """Write the rows of one dataset year to its CSV file as they arrive"""
+
+    def __init__(self, file_path: Path, fieldnames: List[str]):
+        self.file_path = file_path
+        self.fieldnames = fieldnames
+        self.records = 0
+        self._temp_path = file_path.with_suffix(".tmp")
+        self._file = None
+        self._writer = None
+
+    def append(self, entry: Dict) -> None:
+        """Write one row, creating the file with its header on the first row"""
+        if self._writer is None:
+            self._file = open(self._temp_path, "w", newline="")
+            self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames)
+            self._writer.writeheader()
+
+        self._writer.writerow(entry)
+        self.records += 1
+
+    def close(self) -> int:
+        """Close the file and move it into place, returning the number of rows written"""
+        if self._file is None:
+            return 0
+
+        # The file only gets its final name once complete, so an interrupted
+        # download is never mistaken for an existing year on the next run
+        self._file.close()
+        self._temp_path.replace(self.file_path)
+
+        return self.records
+
+
 class DataDownloader:
     def __init__(self):
         self._validate_api_key()
         self.contiguous_states = self._get_contiguous_states()
         self.counties_by_state = self._get_counties_by_state()
 
+        # Resolve each Census dataset's variables for every year once, up front
+        self.variables_by_year = {
+            (dataset, year): self._get_variables_for_year(dataset, year)
+            for dataset, dataset_config in CONFIG["DATASETS"].items()
+            if dataset_config.get("DATA_SOURCE") != "datacommons"
+            for year in self._get_years_from_range(dataset_config["YEARS"])
+        }
+
     def _validate_api_key(self):
         if not CONFIG["US_CENSUS_API_KEY"]:
             raise ValueError("US_CENSUS_API_KEY not found in .env file")
@@ -108,7 +174,7 @@ class DataDownloader:
         """Get list of contiguous state codes for all datasets"""
         state_data_dir = CONFIG["BASE_DATA_DIR"] / "state_data"
         state_data_dir.mkdir(parents=True, exist_ok=True)
-        state_file = state_data_dir / "state_names.csv"
+        state_file = state_data_dir / "state_names.parquet"
 
         if not state_file.exists():
             state_df = ced.download(
@@ -122,16 +188,18 @@ class DataDownloader:
             state_df = state_df[
                 ~state_df["STATE"].astype(str).isin(CONFIG["EXCLUDED_STATES"])
             ]
-            state_df.to_csv(state_file, index=False)
+            # Parquet keeps the zero-padded codes as strings, so reads need no reformatting
+            state_df["STATE"] = state_df["STATE"].astype(str).str.zfill(2)
+            state_df.to_parquet(state_file, index=False)
 
-        state_df = pd.read_csv(state_file)
-        return state_df["STATE"].astype(str).str.zfill(2).tolist()
+        state_df = pd.read_parquet(state_file, columns=["STATE"])
+        return state_df["STATE"].tolist()
     
     def _get_counties_by_state(self) -> Dict[str, List[str]]:
         """Get a mapping of state codes to their county codes"""
         counties_data_dir = CONFIG["BASE_DATA_DIR"] / "county_data"
         counties_data_dir.mkdir(parents=True, exist_ok=True)
-        counties_file = counties_data_dir / "county_names.csv"
+        counties_file = counties_data_dir / "county_names.parquet"
         
         if not counties_file.exists():
             # Download county data
@@ -143,17 +211,16 @@ class DataDownloader:
                 download_variables=["NAME"],
                 api_key=CONFIG["US_CENSUS_API_KEY"],
             )
-            counties_df.to_csv(counties_file, index=False)
+            counties_df["STATE"] = counties_df["STATE"].astype(str).str.zfill(2)
+            counties_df["COUNTY"] = counties_df["COUNTY"].astype(str).str.zfill(3)
+            counties_df.to_parquet(counties_file, index=False)
         
-        counties_df = pd.read_csv(counties_file)
+        counties_df = pd.read_parquet(counties_file, columns=["STATE", "COUNTY"])
         
-        # Create dictionary mapping state to county codes
-        counties_by_state = {}
-        for state in self.contiguous_states:
-            state_counties = counties_df[counties_df["STATE"] == int(state)]["COUNTY"].astype(str).str.zfill(3).tolist()
-            counties_by_state[state] = state_counties
+        # Create dictionary mapping state to county codes in one grouped pass
+        grouped = counties_df.groupby("STATE", sort=False)["COUNTY"].agg(list).to_dict()
             
-        return counties_by_state
+        return {state: grouped.get(state, []) for state in self.contiguous_states}
 
     @staticmethod
     def _get_years_from_range(year_range: Tuple[int, int]) -> List[int]:
@@ -185,6 +252,11 @@ class DataDownloader:
 
         raise ValueError(f"Invalid variable configuration for {dataset}")
 
+    @staticmethod
+    def _get_output_file(dataset: str, year: int) -> Path:
+        """Path of the CSV file holding a Census dataset for a specific year"""
+        return CONFIG["BASE_DATA_DIR"] / f"{dataset.lower()}_data" / f"census_{dataset.lower()}_data_{year}.csv"
+
     def _download_single_dataset_year(self, dataset: str, year: int) -> None:
         """Download a single dataset for a specific year"""
         dataset_config = CONFIG["DATASETS"][dataset]
@@ -193,16 +265,11 @@ class DataDownloader:
         if dataset_config.get("DATA_SOURCE") == "datacommons":
             return
 
-        data_dir = CONFIG["BASE_DATA_DIR"] / f"{dataset.lower()}_data"
-        data_dir.mkdir(parents=True, exist_ok=True)
-
-        output_file = data_dir / f"census_{dataset.lower()}_data_{year}.csv"
-        if output_file.exists():
-            print(f"Skipping existing {dataset} {year}")
-            return
+        output_file = self._get_output_file(dataset, year)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            variables = self._get_variables_for_year(dataset, year)
+            variables = self.variables_by_year[(dataset, year)]
             print(f"Downloading {dataset} data for {year}...")
 
             df = ced.download(
@@ -231,6 +298,16 @@ class DataDownloader:
 
         years = self._get_years_from_range(dataset_config["YEARS"])
 
+        # Only submit downloads for the years that are not on disk yet
+        missing_years = [
+            year for year in years
+            if not self._get_output_file(dataset, year).exists()
+        ]
+        if len(missing_years) < len(years):
+            print(f"Skipping {len(years) - len(missing_years)} existing {dataset} years")
+        if not missing_years:
+            return
+
         # Use concurrent futures for parallel downloading
         with concurrent.futures.ThreadPoolExecutor(
             max_workers=CONFIG["MAX_WORKERS"]
@@ -238,7 +315,7 @@ class DataDownloader:
             # Create a list of futures for each year
             futures = [
                 executor.submit(self._download_single_dataset_year, dataset, year)
-                for year in years
+                for year in missing_years
             ]
 
             # Wait for all futures to complete
@@ -271,8 +348,13 @@ class DataDownloader:
         
         print(f"Downloading missing {dataset} data from Data Commons...")
         
-        # Create a dictionary to store all data (global to all threads)
-        all_data = {year: [] for year in years_range if year not in existing_files}
+        # Stream each missing year's rows straight to its CSV file instead of
+        # holding every row in memory until the download finishes
+        fieldnames = ["STATE", *dataset_config["VARIABLES"]] + (["COUNTY"] if level == "county" else [])
+        all_data = {
+            year: _YearFileWriter(output_dir / f"{level}_{dataset.lower()}_data_{year}.csv", fieldnames)
+            for year in years_range if year not in existing_files
+        }
         
         # Process based on level (state or county)
         if level == "state":
@@ -295,81 +377,105 @@ class DataDownloader:
                             self._fetch_datacommons_for_geo,
                             geo_id=f"geoId/{state_fips}",
                             variables=dataset_config["VARIABLES"],
-                            all_data=all_data,
                             years_range=years_range,
                             existing_files=existing_files,
                             state=state_fips
                         )
                     )
                 
-                # Wait for all futures to complete
+                # Collect each state's rows as it completes; only this thread touches all_data
                 for future in concurrent.futures.as_completed(futures):
                     try:
-                        future.result()
+                        for year_int, entry in future.result():
+                            all_data[year_int].append(entry)
                     except Exception as e:
                         print(f"Error in thread: {str(e)}")
                         
         elif level == "county":
-            # County level data - create a list of all county tasks
-            county_tasks = []
-            
-            for state_fips in self.contiguous_states:
-                for county_fips in self.counties_by_state.get(state_fips, []):
-                    county_tasks.append((state_fips, county_fips))
+            # County level data - fetch every variable for a batch of counties per request
+            geo_ids = [
+                f"geoId/{state_fips}{county_fips}"
+                for state_fips in self.contiguous_states
+                for county_fips in self.counties_by_state.get(state_fips, [])
+            ]
+            batch_size = CONFIG["DATACOMMONS_BATCH_SIZE"]
+            batches = [geo_ids[i:i + batch_size] for i in range(0, len(geo_ids), batch_size)]
             
-            # Process counties in parallel using a thread pool
+            # Process batches in parallel using a thread pool
             with concurrent.futures.ThreadPoolExecutor(max_workers=CONFIG["MAX_COUNTY_WORKERS"]) as executor:
-                futures = []
-                
-                for state_fips, county_fips in county_tasks:
-                    geo_id = f"geoId/{state_fips}{county_fips}"
-                    futures.append(
-                        executor.submit(
-                            self._fetch_datacommons_for_geo,
-                            geo_id=geo_id,
-                            variables=dataset_config["VARIABLES"],
-                            all_data=all_data,
-                            years_range=years_range,
-                            existing_files=existing_files,
-                            state=state_fips,
-                            county=county_fips
-                        )
-                    )
+                futures = {
+                    executor.submit(
+                        _cached_datacommons_call, dc.get_stat_all, batch, dataset_config["VARIABLES"]
+                    ): batch
+                    for batch in batches
+                }
                 
                 # Use a progress counter
                 completed = 0
-                total = len(futures)
+                total = len(geo_ids)
                 
-                # Wait for all futures to complete while showing progress
+                # Collect the rows on this thread as each batch completes, showing progress
                 for future in concurrent.futures.as_completed(futures):
+                    completed += len(futures[future])
                     try:
-                        future.result()
-                        completed += 1
-                        if completed % 50 == 0 or completed == total:
-                            print(f"Progress: {completed}/{total} counties processed ({completed/total*100:.1f}%)")
+                        self._collect_datacommons_county_stats(
+                            future.result(),
+                            variables=dataset_config["VARIABLES"],
+                            all_data=all_data,
+                            years_range=years_range,
+                            existing_files=existing_files,
+                        )
+                        print(f"Progress: {completed}/{total} counties processed ({completed/total*100:.1f}%)")
                     except Exception as e:
-                        print(f"Error in county download thread: {str(e)}")
-                        completed += 1
+                        print(f"Error in county download batch: {str(e)}")
         
-        # Save separate CSV files for each year
-        for year, data in all_data.items():
-            if data:
-                df = pd.DataFrame(data)
-                file_path = output_dir / f"{level}_{dataset.lower()}_data_{year}.csv"
-                df.to_csv(file_path, index=False)
-                print(f"Saved {dataset} data for year {year} with {len(df)} records")
+        # Finish the CSV file of each year that received data
+        for year, year_writer in all_data.items():
+            records = year_writer.close()
+            if records:
+                print(f"Saved {dataset} data for year {year} with {records} records")
     
+    @staticmethod
+    def _collect_datacommons_county_stats(
+        stats: Dict,
+        variables: List[str],
+        all_data: Dict,
+        years_range: range,
+        existing_files: Dict,
+    ) -> None:
+        """Add the rows of a Data Commons bulk response for a batch of counties"""
+        for geo_id, geo_stats in stats.items():
+            county_fips = geo_id.split("/")[-1]
+            state, county = county_fips[:2], county_fips[2:]
+            
+            for variable in variables:
+                source_series = ((geo_stats or {}).get(variable) or {}).get("sourceSeries")
+                if not source_series:
+                    continue
+                
+                # Series are ranked by Data Commons, use the preferred one like get_stat_series does
+                for year, value in source_series[0].get("val", {}).items():
+                    year_int = int(year[:4])  # Dates may carry a month, keep the year
+                    
+                    # Only process years that are within range and don't already exist in files
+                    if year_int in years_range and year_int not in existing_files:
+                        all_data[year_int].append({
+                            "STATE": state,
+                            variable: value,
+                            "COUNTY": county,
+                        })
+
     def _fetch_datacommons_for_geo(
         self, 
         geo_id: str, 
         variables: List[str], 
-        all_data: Dict,
         years_range: range,
         existing_files: Dict,
         state: str,
         county: Optional[str] = None
-    ) -> None:
-        """Fetch Data Commons data for a specific geography"""
+    ) -> List[Tuple[int, Dict]]:
+        """Fetch Data Commons data for a specific geography as (year, row) pairs"""
+        rows = []
         try:
             geo_name = f"FIPS: {state}" if county is None else f"FIPS: {state}{county}"
             
@@ -379,7 +485,7 @@ class DataDownloader:
             
             # Process variables in sequence (Data Commons API might have rate limits)
             for variable in variables:
-                data = dc.get_stat_series(geo_id, variable) 
+                data = _cached_datacommons_call(dc.get_stat_series, geo_id, variable)
                 
                 if data:  # Check if data exists
                     # For each year in the data
@@ -406,9 +512,7 @@ class DataDownloader:
                             if county:
                                 entry["COUNTY"] = county
                                 
-                            # Thread-safe append to the data dictionary - use year_int directly
-                            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as lock_executor:
-                                lock_executor.submit(lambda: all_data[year_int].append(entry))
+                            rows.append((year_int, entry))
         except Exception as e:
             if county is None:
                 print(f"Error fetching data for {geo_id}: {str(e)}")
@@ -416,6 +520,8 @@ class DataDownloader:
             elif "404" not in str(e):  # Ignore common 404 errors for counties
                 print(f"Error for {geo_id}: {str(e)[:100]}...")
 
+        return rows
+
     def download_all_data(self):
         """Download all datasets with timing"""
         start_time = time.time()
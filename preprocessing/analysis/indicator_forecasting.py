@@ -1,6 +1,9 @@
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
 from pathlib import Path
-from sklearn.discriminant_analysis import StandardScaler
 
 # Define directory paths
 DATA_DIR = Path("./data")
@@ -34,44 +37,45 @@ def calculate_z_scores(df):
         if indicator not in df.columns:
             print(f"Warning: {indicator} not found in the data")
     
-    # Group by scenario to calculate z-scores within each scenario
-    for scenario in df['scenario'].unique():
-        # Filter data for current scenario
-        scenario_mask = df['scenario'] == scenario
-        
-        # Calculate z-scores for each indicator
-        for indicator in indicators:
-            if indicator in df.columns:
-                # Get data for this indicator in this scenario
-                data = df.loc[scenario_mask, indicator]
-                
-                # Skip if all values are NaN
-                if data.isna().all():
-                    print(f"Warning: All values are NaN for {indicator} in scenario {scenario}")
-                    continue
-                
-                # Calculate mean and standard deviation for non-null values
-                mean = data.mean()
-                std = data.std()
-                
-                # Avoid division by zero
-                if std == 0:
-                    print(f"Warning: Standard deviation is 0 for {indicator} in scenario {scenario}")
-                    # Set all z-scores to 0 if std dev is 0
-                    df.loc[scenario_mask, f"z_{indicator}"] = 0
-                else:
-                    # Manually calculate z-scores: (value - mean) / std
-                    df.loc[scenario_mask, f"z_{indicator}"] = ((data - mean) / std).round(4)
+    indicators = [indicator for indicator in indicators if indicator in df.columns]
+
+    # Mean and standard deviation of each indicator within each scenario,
+    # computed in one grouped pass over the non-null values
+    grouped = df.groupby('scenario', observed=True)[indicators]
+    counts = grouped.count()
+    means = grouped.mean()
+    stds = grouped.std()
+
+    for indicator in indicators:
+        for scenario in counts.index[counts[indicator] == 0]:
+            print(f"Warning: All values are NaN for {indicator} in scenario {scenario}")
+        for scenario in stds.index[stds[indicator] == 0]:
+            print(f"Warning: Standard deviation is 0 for {indicator} in scenario {scenario}")
+
+    # Broadcast each row's scenario statistics back onto the row
+    row_means = means.reindex(df['scenario']).to_numpy()
+    row_stds = stds.reindex(df['scenario']).to_numpy()
+
+    # Calculate z-scores: (value - mean) / std, set to 0 where std dev is 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z_scores = np.round((df[indicators].to_numpy(dtype=float) - row_means) / row_stds, 4)
+    z_scores[row_stds == 0] = 0
+
+    df[[f"z_{indicator}" for indicator in indicators]] = z_scores
     return df
 
+# Read the shared identifier columns as strings, so every dataset merges on
+# the same types and FIPS codes can be zero-padded once after loading
+KEY_DTYPES = {"county_fips": str, "state": str, "county": str}
+
 def load_and_merge_data():
     """Load and merge all datasets into a single dataframe"""
-    # Load individual datasets
-    economic_df = pd.read_csv(ECONOMIC_DATA)
-    education_df = pd.read_csv(EDUCATION_DATA)
-    housing_df = pd.read_csv(HOUSING_DATA)
-    job_openings_df = pd.read_csv(JOB_OPENINGS_DATA)
-    public_school_df = pd.read_csv(PUBLIC_SCHOOL_DATA)
+    # Load individual datasets with the multithreaded pyarrow CSV reader
+    economic_df = pd.read_csv(ECONOMIC_DATA, engine="pyarrow", dtype=KEY_DTYPES)
+    education_df = pd.read_csv(EDUCATION_DATA, engine="pyarrow", dtype=KEY_DTYPES)
+    housing_df = pd.read_csv(HOUSING_DATA, engine="pyarrow", dtype=KEY_DTYPES)
+    job_openings_df = pd.read_csv(JOB_OPENINGS_DATA, engine="pyarrow", dtype=KEY_DTYPES)
+    public_school_df = pd.read_csv(PUBLIC_SCHOOL_DATA, engine="pyarrow", dtype=KEY_DTYPES)
     
     # Merge all dataframes on COUNTY_FIPS
     merged_df = economic_df.merge(
@@ -87,6 +91,11 @@ def load_and_merge_data():
     # Drop columns containing 'z_score'
     merged_df = merged_df.loc[:, ~merged_df.columns.str.contains('z_score', case=False)]
     
+    # Format the FIPS codes once, every later step relies on them being padded
+    merged_df["county_fips"] = merged_df["county_fips"].str.zfill(5)
+    merged_df["state"] = merged_df["state"].str.zfill(2)
+    merged_df["county"] = merged_df["county"].str.zfill(3)
+
     # Set school data to 0 for years other than 2023
     merged_df.loc[merged_df["year"] != 2023, ["public_school_students", "public_school_teachers", "student_teacher_ratio"]] = 0
     
@@ -106,24 +115,19 @@ def prepare_filtered_data(merged_df):
         'population', 'year', 'occupied_housing_units',
     ]
     
-    filtered_df = merged_df[filter_columns]
-    filtered_df = filtered_df[filtered_df["year"] == 2023]
-    filtered_df['county_fips'] = filtered_df['county_fips'].astype(str).str.zfill(5)
-    
-    return filtered_df
+    # Select the 2023 rows and the needed columns in one step, yielding a single copy
+    return merged_df.loc[merged_df["year"] == 2023, filter_columns]
 
 def process_population_data():
     """Process population data and calculate percentage changes"""
-    pop_project_df = pd.read_csv(POP_PROJECT)
-    pop_2023 = pd.read_csv(POP_2023)
+    # Both files store zero-padded FIPS codes, so reading them as strings keeps the padding
+    pop_project_df = pd.read_csv(POP_PROJECT, dtype={"county_fips": str})
+    pop_2023 = pd.read_csv(POP_2023, dtype={"STATE": str, "COUNTY": str})
 
     pop_2023.columns = pop_2023.columns.str.lower()
     
-    # Format county FIPS codes
-    pop_2023["state"] = pop_2023["state"].astype(str).str.zfill(2)
-    pop_2023["county"] = pop_2023["county"].astype(str).str.zfill(3)
+    # Build the county FIPS codes
     pop_2023["county_fips"] = pop_2023["state"] + pop_2023["county"]
-    pop_project_df["county_fips"] = pop_project_df["county_fips"].astype(str).str.zfill(5)
     
     # Merge population datasets
     pop_combined = pop_project_df.merge(
@@ -140,121 +144,104 @@ def process_population_data():
         "population_2065_s5c", "climate_region", "population_2010"
     ]]
     
-    # Calculate percentage changes for each scenario
-    pop_combined["s3_percentage_change"] = ((pop_combined["population_2065_s3"] - pop_combined["population_2023"]) / pop_combined["population_2023"]) * 100
-    pop_combined["s5b_percentage_change"] = ((pop_combined["population_2065_s5b"] - pop_combined["population_2023"]) / pop_combined["population_2023"]) * 100
-    pop_combined["s5a_percentage_change"] = ((pop_combined["population_2065_s5a"] - pop_combined["population_2023"]) / pop_combined["population_2023"]) * 100
-    pop_combined["s5c_percentage_change"] = ((pop_combined["population_2065_s5c"] - pop_combined["population_2023"]) / pop_combined["population_2023"]) * 100
+    # Calculate percentage changes for every scenario in one block operation
+    scenarios = ["s3", "s5b", "s5a", "s5c"]
+    base = pop_combined[["population_2023"]].to_numpy(dtype=float)
+    projected = pop_combined[[f"population_2065_{scenario}" for scenario in scenarios]].to_numpy(dtype=float)
+    pop_combined[[f"{scenario}_percentage_change" for scenario in scenarios]] = (projected - base) / base * 100
     
     return pop_combined
 
-def calculate_projected_values(df, base_year, percentage_change, scenario_name):
-    """Calculate projected values based on percentage change"""
-    projected_df = df[df["year"] == base_year].copy()
-    projected_df["scenario"] = scenario_name
-    
+def generate_county_projections(filtered_df, pop_combined):
+    """Generate projections for all counties under different scenarios"""
+    scenarios = ["s3", "s5b", "s5a", "s5c"]
+
+    # Get original data for base year
+    base_df = filtered_df[filtered_df["year"] == 2023]
+
+    # Each county's percentage change under every scenario
+    percentage_changes = pop_combined.drop_duplicates("county_fips").set_index("county_fips")[
+        [f"{scenario}_percentage_change" for scenario in scenarios]
+    ]
+
+    has_projection = base_df["county_fips"].isin(percentage_changes.index)
+    for county in base_df.loc[~has_projection, "county_fips"].unique():
+        print(f"Skipping county_fips {county} - no projection data found.")
+    base_df = base_df[has_projection]
+
     # Exclude columns that should not be scaled
     columns_to_exclude = ["county_fips", "state", "county", "year", "name", "scenario"]
-    numeric_cols = [col for col in df.columns if col not in columns_to_exclude]
-    
-    # Scale the numeric columns for the projected values
-    for col in numeric_cols:
-        projected_df[col] = round(projected_df[col] * (1 + percentage_change / 100))
-    
-    return projected_df
+    numeric_cols = [col for col in base_df.columns if col not in columns_to_exclude]
 
-def generate_county_projections(filtered_df, pop_combined):
-    """Generate projections for all counties under different scenarios"""
-    # Get all unique counties
-    all_counties = filtered_df['county_fips'].unique()
-    
-    # Create an empty DataFrame to store all results
-    all_counties_2065_combined = pd.DataFrame()
-    
-    # Process each county
-    for county in all_counties:
-        # Filter data for the current county
-        county_df = filtered_df[filtered_df['county_fips'] == county].copy()
-        
-        # Get original data for base year
-        original_df = county_df[county_df["year"] == 2023].copy()
-        original_df["scenario"] = "original"
-        
-        # Extract this county's percentage changes
-        county_proj = pop_combined[pop_combined["county_fips"] == county]
-        if county_proj.empty:
-            print(f"Skipping county_fips {county} - no projection data found.")
-            continue
-            
-        percentage_changes = county_proj[
-            ["s3_percentage_change", "s5b_percentage_change", "s5a_percentage_change", "s5c_percentage_change"]
-        ].iloc[0].to_dict()
-        
-        # Calculate projections for each scenario
-        s3_2065 = calculate_projected_values(county_df, base_year=2023,
-                                           percentage_change=percentage_changes["s3_percentage_change"],
-                                           scenario_name="s3")
-        
-        s5b_2065 = calculate_projected_values(county_df, base_year=2023,
-                                            percentage_change=percentage_changes["s5b_percentage_change"],
-                                            scenario_name="s5b")
-        
-        s5a_2065 = calculate_projected_values(county_df, base_year=2023,
-                                            percentage_change=percentage_changes["s5a_percentage_change"],
-                                            scenario_name="s5a")
-        
-        s5c_2065 = calculate_projected_values(county_df, base_year=2023,
-                                            percentage_change=percentage_changes["s5c_percentage_change"],
-                                            scenario_name="s5c")
-        
-        # Combine all scenarios for this county
-        county_2065_combined = pd.concat([original_df, s3_2065, s5b_2065, s5a_2065, s5c_2065],
-                                       ignore_index=True)
-        
-        # Add to the master DataFrame
-        all_counties_2065_combined = pd.concat([all_counties_2065_combined, county_2065_combined],
-                                             ignore_index=True)
+    # Scale the numeric block of every county by its scenario's growth factor,
+    # one (rows, columns) multiply per scenario
+    values = base_df[numeric_cols].to_numpy(dtype=float)
+    factors = 1 + percentage_changes.reindex(base_df["county_fips"]).to_numpy(dtype=float) / 100
+
+    scenario_frames = [base_df.assign(scenario="original")]
+    for i, scenario in enumerate(scenarios):
+        projected_df = base_df.assign(scenario=scenario)
+        projected_df[numeric_cols] = np.round(values * factors[:, [i]])
+        scenario_frames.append(projected_df)
+
+    all_counties_2065_combined = pd.concat(scenario_frames, ignore_index=True)
+
+    # Keep each county's scenarios together, in the order they were built
+    row_order = np.argsort(np.tile(np.arange(len(base_df)), len(scenario_frames)), kind="stable")
+    all_counties_2065_combined = all_counties_2065_combined.iloc[row_order].reset_index(drop=True)
+
+    # Every county and scenario repeats across rows, so store both keys as
+    # categoricals; the downstream lookups and groupbys then hash integer codes
+    all_counties_2065_combined["scenario"] = pd.Categorical(
+        all_counties_2065_combined["scenario"], categories=["original", *scenarios]
+    )
+    all_counties_2065_combined["county_fips"] = all_counties_2065_combined["county_fips"].astype("category")
     
     return all_counties_2065_combined
 
 def calculate_derived_metrics(all_counties_2065_combined, merged_df):
     """Calculate derived metrics for projected data"""
-    merged_df_2023 = merged_df[merged_df["year"] == 2023].copy()
-    merged_df_2023["county_fips"] = merged_df_2023["county_fips"].astype(str).str.zfill(5)
-    all_counties = merged_df_2023['county_fips'].unique()
-    
-    for county in all_counties:
-        all_counties_2065_combined["county_fips"] = all_counties_2065_combined["county_fips"].astype(str).str.zfill(5)
-        county_df = merged_df_2023[merged_df_2023['county_fips'] == county].copy()
-        teachers_2023 = county_df["public_school_teachers"]
-        housing_units_2023 = county_df["total_housing_units"]
-        employed_population_2023 = county_df["total_employed_population"]
-        
-        if teachers_2023.empty or housing_units_2023.empty or employed_population_2023.empty:
-            print(f"Missing data for county_fips {county}")
-            
-        # Ensure the correct teacher count is applied for each county
-        teacher_count = teachers_2023.values[0] if not teachers_2023.empty else 1  # Avoid division by zero
-        all_counties_2065_combined.loc[all_counties_2065_combined['county_fips'] == county, "student_teacher_ratio"] = (
-            all_counties_2065_combined.loc[all_counties_2065_combined['county_fips'] == county, "public_school_students"] / teacher_count
-        )
-        
-        housing_units_count = housing_units_2023.values[0] if not housing_units_2023.empty else 1  # Avoid division by zero
-        all_counties_2065_combined.loc[all_counties_2065_combined['county_fips'] == county, "available_housing_units"] = (
-            housing_units_count - all_counties_2065_combined.loc[all_counties_2065_combined['county_fips'] == county, "occupied_housing_units"])
-        
-        employed_population_count = employed_population_2023.values[0] if not employed_population_2023.empty else 1  # Avoid division by zero
-        all_counties_2065_combined.loc[all_counties_2065_combined['county_fips'] == county, "total_employed_percentage"] = (
-            employed_population_count / all_counties_2065_combined.loc[all_counties_2065_combined['county_fips'] == county, "total_labor_force"]) * 100
-        
-        all_counties_2065_combined.loc[all_counties_2065_combined['county_fips'] == county, "unemployment_rate"] = (
-            100 - all_counties_2065_combined.loc[all_counties_2065_combined['county_fips'] == county, "total_employed_percentage"])
-    # Format the state and county codes
-    all_counties_2065_combined["state"] = all_counties_2065_combined["state"].astype(str).str.zfill(2)
-    all_counties_2065_combined["county"] = all_counties_2065_combined["county"].astype(str).str.zfill(3)
+    # County FIPS codes were zero-padded when the datasets were loaded
+    merged_df_2023 = merged_df[merged_df["year"] == 2023]
+
+    # 2023 counts for each county, aligned to every projected row in one lookup
+    lookup = merged_df_2023.drop_duplicates("county_fips").set_index("county_fips")[
+        ["public_school_teachers", "total_housing_units", "total_employed_population"]
+    ]
+    teachers_2023, housing_units_2023, employed_population_2023 = (
+        lookup.reindex(all_counties_2065_combined["county_fips"]).to_numpy(dtype=float).T
+    )
+
+    missing = ~all_counties_2065_combined["county_fips"].isin(lookup.index)
+    for county in all_counties_2065_combined.loc[missing, "county_fips"].unique():
+        print(f"Missing data for county_fips {county}")
+
+    # A county without teachers has no meaningful ratio; leave it missing
+    # rather than dividing by zero
+    all_counties_2065_combined["student_teacher_ratio"] = (
+        all_counties_2065_combined["public_school_students"] / np.where(teachers_2023 == 0, np.nan, teachers_2023)
+    )
+
+    all_counties_2065_combined["available_housing_units"] = (
+        housing_units_2023 - all_counties_2065_combined["occupied_housing_units"])
+
+    all_counties_2065_combined["total_employed_percentage"] = (
+        employed_population_2023 / all_counties_2065_combined["total_labor_force"]) * 100
+
+    all_counties_2065_combined["unemployment_rate"] = (
+        100 - all_counties_2065_combined["total_employed_percentage"])
     
     return all_counties_2065_combined
 
+# Weights of the standardized unemployment rate, student-teacher ratio and
+# available housing units (rows) in each socioeconomic index (columns)
+INDEX_COLUMNS = ['index_balanced', 'index_employment', 'index_housing', 'index_education']
+INDEX_WEIGHTS = np.array([
+    [-0.33, -0.6, -0.2, -0.2],
+    [-0.33, -0.2, -0.2, -0.6],
+    [ 0.33,  0.2,  0.6,  0.2],
+])
+
 def calculate_indices(all_counties_2065_combined):
     """Calculate socioeconomic indices from the projected data"""
     # Filter to include only counties with school data
@@ -263,41 +250,44 @@ def calculate_indices(all_counties_2065_combined):
     # Columns to standardize
     cols = ['unemployment_rate', 'student_teacher_ratio', 'available_housing_units']
     
-    # Standardize the data
-    df_scaled = index_df.copy()
-    z_scaler = StandardScaler()
-    df_scaled[[f'z_{c}' for c in cols]] = z_scaler.fit_transform(index_df[cols])
-    
-    # Calculate different indices with different weights
-    # Flip unemployment and student-teacher ratio (lower is better)
-    df_scaled["index_balanced"] = (
-        (-df_scaled["z_unemployment_rate"]) * 0.33 + 
-        (-df_scaled["z_student_teacher_ratio"]) * 0.33 + 
-        df_scaled["z_available_housing_units"] * 0.33
-    )
-    
-    df_scaled["index_employment"] = (
-        (-df_scaled["z_unemployment_rate"]) * 0.6 + 
-        (-df_scaled["z_student_teacher_ratio"]) * 0.2 + 
-        df_scaled["z_available_housing_units"] * 0.2
-    )
-    
-    df_scaled["index_housing"] = (  # Fixed typo in variable name
-        (-df_scaled["z_unemployment_rate"]) * 0.2 + 
-        (-df_scaled["z_student_teacher_ratio"]) * 0.2 + 
-        df_scaled["z_available_housing_units"] * 0.6
-    )
+    # Standardize the data the way sklearn's StandardScaler does: population
+    # std, NaNs ignored when fitting, and constant columns left unscaled
+    values = index_df[cols].to_numpy(dtype=float)
+    std = np.nanstd(values, axis=0)
+    z_values = (values - np.nanmean(values, axis=0)) / np.where(std == 0, 1.0, std)
+    index_df[[f'z_{c}' for c in cols]] = z_values
     
-    df_scaled["index_education"] = (
-        (-df_scaled["z_unemployment_rate"]) * 0.2 + 
-        (-df_scaled["z_student_teacher_ratio"]) * 0.6 + 
-        df_scaled["z_available_housing_units"] * 0.2
-    )
+    # Calculate all indices in one product: each column of the matrix holds an
+    # index's weights, with unemployment and student-teacher ratio flipped
+    # (lower is better)
+    index_df[INDEX_COLUMNS] = z_values @ INDEX_WEIGHTS
     
     # Extract results and return
-    results_df = df_scaled[['county_fips', 'scenario', 'index_balanced', 'index_employment', 'index_housing', 'index_education']]
+    results_df = index_df[['county_fips', 'scenario', *INDEX_COLUMNS]]
     return results_df
 
+def _float_csv_text(column):
+    """Format a float column as text, keeping the ".0" pyarrow drops from whole values"""
+    text = pc.cast(column, pa.string())
+    is_whole = pc.match_substring_regex(text, r"^-?\d+$")
+    return pc.if_else(is_whole, pc.binary_join_element_wise(text, ".0", ""), text)
+
+def write_csv(df, path):
+    """Write a dataframe to CSV with pyarrow's multithreaded writer"""
+    # Write the category labels as plain strings
+    categorical_cols = df.select_dtypes("category").columns
+    df = df.astype({col: str for col in categorical_cols})
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    # pyarrow writes whole floats like the rounded projected counts as "123",
+    # which update_database would then infer as BIGINT; keep them as "123.0"
+    # so the float columns stay DOUBLE PRECISION as with pandas' to_csv
+    for i, field in enumerate(table.schema):
+        if pa.types.is_floating(field.type):
+            table = table.set_column(i, field.name, _float_csv_text(table.column(i)))
+
+    pa_csv.write_csv(table, path)
+
 def main():
     # Load and prepare data
     merged_df = load_and_merge_data()
@@ -317,7 +307,7 @@ def main():
     all_counties_2065_combined.columns = all_counties_2065_combined.columns.str.lower()
     
     # Save combined projected data
-    all_counties_2065_combined.to_csv(PROJECTED_DATA / "combined_2065_data.csv", index=False)
+    write_csv(all_counties_2065_combined, PROJECTED_DATA / "combined_2065_data.csv")
     
     # Calculate socioeconomic indices
     results_df = calculate_indices(all_counties_2065_combined)
@@ -326,7 +316,7 @@ def main():
     
     # Save results
     output_path = PROJECTED_DATA / "projected_socioeconomic_indices.csv"
-    results_df.to_csv(output_path, index=False)
+    write_csv(results_df, output_path)
     
     print(f"Analysis complete. Results saved to {output_path}")
 
@@ -14,14 +14,10 @@ def main():
     # Census 2065 population projection for the US
     CENSUS_POP_2065 = 366207000
 
-    state_names = pd.read_csv(
-        "./data/raw/state_data/state_names.csv",
-        dtype={
-            'STATE': str,
-        }
+    state_names = pd.read_parquet(
+        "./data/raw/state_data/state_names.parquet",
+        columns=["STATE", "NAME"],
     )
-    
-    state_names = state_names[["STATE", "NAME"]]
 
     us_county_data = pd.read_csv(
         "./data/raw/population_data/census_population_data_2010.csv",
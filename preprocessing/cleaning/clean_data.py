@@ -253,12 +253,12 @@ class DataCleaner:
         
         for year in years:
             try:
-                job_path = PATHS["raw_data"]["job_openings"] / f"state_job_opening_data_{year}.csv"
+                job_path = PATHS["raw_data"]["job_openings"] / f"state_job_opening_data_{year}.parquet"
                 if not job_path.exists():
                     print(f"No job openings data found for {year}")
                     continue
                     
-                job_openings = pd.read_csv(job_path, dtype={'STATE': str})
+                job_openings = pd.read_parquet(job_path).reset_index()
                 job_openings['STATE'] = job_openings['STATE'].str.zfill(2)
                 
                 if year not in county_with_pop:
@@ -134,9 +134,10 @@ def create_job_openings_csvs(yearly_data, output_dir):
             df_year.set_index("STATE", inplace=True)
             df_year.sort_index(inplace=True)
 
-        # Save to CSV
-        output_path = output_dir / f"state_job_opening_data_{year}.csv"
-        df_year.to_csv(output_path)
+        # Save to Parquet, which keeps the zero-padded STATE codes and
+        # numeric types for clean_data without re-parsing text
+        output_path = output_dir / f"state_job_opening_data_{year}.parquet"
+        df_year.to_parquet(output_path, compression="zstd")
         print(f"Saved {output_path}")
 
 def process_job_openings(input_dir, output_dir):
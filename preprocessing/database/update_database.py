@@ -1,6 +1,7 @@
 import os
 from pathlib import Path
 import pandas as pd
+from sqlalchemy import text
 from sqlalchemy.engine.base import Connection
 
 from utils.helpers import get_db_connection
@@ -23,22 +24,43 @@ def upload_csvs_to_postgres(
             filepath = os.path.join(folder_path, filename)
 
             print(f"Processing {filename}...")
-            # Read CSV
-            df = pd.read_csv(filepath, dtype={"COUNTY_FIPS": str})
+            # Read CSV only to let pandas infer the column types; the rows
+            # themselves are streamed from the file below
+            schema_df = pd.read_csv(filepath, dtype={"COUNTY_FIPS": str}).head(0)
 
             try:
                 # Use a transaction to ensure atomicity for each file
                 with db_con.begin() as transaction:
-                    # Upload to PostgreSQL
-                    df.to_sql(
+                    # Create the (empty) table with the inferred schema
+                    schema_df.to_sql(
                         name=table_name,
                         con=transaction.connection,
                         schema=schema,
                         if_exists="replace",  # Overwrite existing data
                         index=False,
-                        method="multi",  # Batch insert for speed
-                        chunksize=1000,
                     )
+
+                    # Bulk load the raw file with COPY, through the DBAPI
+                    # connection underneath this transaction
+                    with open(filepath, newline="") as csv_file, \
+                            transaction.connection.connection.cursor() as cursor:
+                        cursor.copy_expert(
+                            f'COPY "{schema}"."{table_name}" FROM STDIN WITH CSV HEADER',
+                            csv_file,
+                        )
+
+                    # Index the county key (and year, when present) so the
+                    # dashboard's per-county queries are index lookups rather
+                    # than full table scans. Replacing the table drops the
+                    # old index along with it.
+                    if "county_fips" in schema_df.columns:
+                        key_columns = ["county_fips"] + (
+                            ["year"] if "year" in schema_df.columns else [])
+                        columns = ", ".join(f'"{column}"' for column in key_columns)
+                        transaction.connection.execute(text(
+                            f'CREATE INDEX IF NOT EXISTS "{table_name}_county_fips_idx" '
+                            f'ON "{schema}"."{table_name}" ({columns})'
+                        ))
                 print(f"  ✔ Uploaded {filename} ➔ {schema}.{table_name}")
             except Exception as e:
                 print(f"  ✘ Error uploading {filename}: {e}")
@@ -46,7 +68,7 @@ def upload_csvs_to_postgres(
                 continue
 
 
-if __name__ == "__main__":
+def main():
     db_con = None  # Initialize to None
     try:
         db_con = get_db_connection()
@@ -66,4 +88,8 @@ if __name__ == "__main__":
     finally:
         if db_con is not None:
             db_con.close()
-            print("\nDatabase connection closed.")
\ No newline at end of file
+            print("\nDatabase connection closed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,27 +1,26 @@
-import subprocess
+import importlib
 import sys
+from pathlib import Path
 
-def run_script(module_path):
-    """Runs a Python module and prints its output in real-time."""
-    print(f"--- Running {module_path} ---")
-    process = subprocess.Popen(
-        [sys.executable, "-m", module_path],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=1,
-        universal_newlines=True,
-    )
+# Stages are imported as `preprocessing.*` packages, so put the repository root
+# on the path; running this file directly only adds the scripts/ directory
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-    for line in iter(process.stdout.readline, ""):
-        print(line, end="")
+def run_script(module_path):
+    """Imports a pipeline module and runs its main() in this interpreter.
 
-    process.stdout.close()
-    return_code = process.wait()
+    Running every stage in one process lets them share the already imported
+    pandas/geopandas stack instead of paying interpreter start-up and import
+    costs once per stage.
+    """
+    print(f"--- Running {module_path} ---")
+    module = importlib.import_module(module_path)
+    return_code = module.main()
 
+    # Stages signal failure either by returning a non-zero code or raising
     if return_code:
         print(f"--- Error running {module_path} ---")
-        raise subprocess.CalledProcessError(return_code, module_path)
+        raise RuntimeError(f"{module_path} exited with status {return_code}")
 
     print(f"--- Finished {module_path} ---")
 
@@ -37,11 +36,13 @@ if __name__ == "__main__":
         "preprocessing.database.update_database",
     ]
 
-    try:
-        for script in scripts:
+    for script in scripts:
+        try:
             run_script(script)
-        print("PostgreSQL updated successfully!")
-    except subprocess.CalledProcessError as e:
-        print(f"Pipeline failed at script: {e.cmd}")
-        sys.exit(1)
+        except (Exception, SystemExit) as e:
+            if isinstance(e, SystemExit) and not e.code:
+                continue
+            print(f"Pipeline failed at script: {script} ({e})")
+            sys.exit(1)
 
+    print("PostgreSQL updated successfully!")
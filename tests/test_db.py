@@ -0,0 +1,31 @@
+import pandas as pd
+
+from src.db import _downcast_numeric
+
+
+def test_downcast_numeric_keeps_integers_at_least_int32():
+    df = _downcast_numeric(pd.DataFrame({
+        "county_fips": ["36029", "06037"],
+        "median_gross_rent": [900, 2800],
+        "occupied_housing_units": [20000, 15000],
+        "available_housing_units": [12000, 1000],
+    }))
+
+    assert df["median_gross_rent"].dtype == "int32"
+    assert df["occupied_housing_units"].dtype == "int32"
+
+    # Both would wrap around in int16
+    assert (df["median_gross_rent"] * 12).tolist() == [10800, 33600]
+    assert (df["occupied_housing_units"] + df["available_housing_units"]).tolist() == [32000, 16000]
+
+
+def test_downcast_numeric_leaves_keys_and_large_integers_alone():
+    df = _downcast_numeric(pd.DataFrame({
+        "county_fips": ["36029"],
+        "total": [2**40],
+        "rate": [4.5],
+    }))
+
+    assert df["county_fips"].dtype == object
+    assert df["total"].dtype == "int64"
+    assert df["rate"].dtype == "float32"
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from sqlalchemy import create_engine
 from dotenv import load_dotenv
 from urllib.parse import urlparse
@@ -35,14 +36,19 @@ print("------------------------------------------")
 print()
 
 
+@lru_cache(maxsize=None)
+def get_db_engine():
+    """Create the PostgreSQL engine on first use and reuse it afterwards"""
+    return create_engine(
+        DATABASE_URL.replace("postgres://", "postgresql://", 1),
+        connect_args={"sslmode": SSL_MODE},
+    )
+
+
 def get_db_connection():
     """Create and return a PostgreSQL database connection"""
     try:
-        engine = create_engine(
-            DATABASE_URL.replace("postgres://", "postgresql://", 1),
-            connect_args={"sslmode": SSL_MODE},
-        )
-        conn = engine.connect()
+        conn = get_db_engine().connect()
         return conn
     except Exception as e:
         raise Exception(f"Database connection failed: {str(e)}")